@@ -4,36 +4,55 @@ This module provides a CLI for managing data archives with manifest files.
 It supports file tracking, remote synchronization, and archive operations.
 """
 
+import copy
+import functools
+import hashlib
+import io
+import json
 import logging
 import os
+import shlex
+import shutil
 import subprocess
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple
 
 import click
 import colorama
-import yaml
 from colorama import Fore, Style
 
 from . import __version__
 
-# Initialize colorama for cross-platform colored output
-colorama.init()
+# Initialize colorama for cross-platform colored output. Skip the stdout
+# wrapper entirely when not attached to a terminal (CI, pipelines): it adds
+# a Python callback to every write.
+if sys.stdout.isatty():
+    colorama.init()
+
+# Precomputed message templates for the validate fan-out hot loop
+_PUSH_OK = f"{Fore.GREEN}Success pushing {{}}{Style.RESET_ALL}"
+_PUSH_ERR = f"{Fore.RED}Error pushing {{}}{Style.RESET_ALL}"
 
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter that adds colors to log messages."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        if record.levelno >= logging.ERROR:
-            color = Fore.RED
-        elif record.levelno >= logging.WARNING:
-            color = Fore.YELLOW
-        else:
-            color = Fore.GREEN
+    # Precomputed level -> color table avoids per-record branching
+    _COLORS = {
+        logging.CRITICAL: Fore.RED,
+        logging.ERROR: Fore.RED,
+        logging.WARNING: Fore.YELLOW,
+        logging.INFO: Fore.GREEN,
+        logging.DEBUG: Fore.GREEN,
+    }
+    _RESET = Style.RESET_ALL
 
-        return f"{color}{record.getMessage()}{Style.RESET_ALL}"
+    def format(self, record: logging.LogRecord) -> str:
+        color = self._COLORS.get(record.levelno // 10 * 10, Fore.GREEN)
+        return f"{color}{record.getMessage()}{self._RESET}"
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -70,42 +89,404 @@ def ensure_gitignore(local_ref_path: str) -> None:
     local_path_entry = local_ref_path.strip()
 
     if gitignore_path.exists():
-        with gitignore_path.open("r+", encoding="utf-8") as file:
-            lines = [line.strip() for line in file.readlines()]
-            if local_path_entry not in lines:
-                file.write(f"\n{local_path_entry}\n")
+        # Single bytes scan instead of building a Python list of lines
+        data = gitignore_path.read_bytes()
+        entry = local_path_entry.encode()
+        if (
+            data.startswith(entry + b"\n")
+            or b"\n" + entry + b"\n" in data
+            or data.endswith(b"\n" + entry)
+            or data == entry
+        ):
+            return
+        with gitignore_path.open("ab") as file:
+            file.write(b"\n" + entry + b"\n")
     else:
         with gitignore_path.open("w", encoding="utf-8") as file:
             file.write(f"{local_path_entry}\n")
 
 
 
-def process_archive_files(cmd: list[str]):
+@functools.lru_cache(maxsize=None)
+def _which(program: str) -> str:
+    """Resolve a program to an absolute path once per process.
+
+    Passing an absolute path to subprocess keeps CPython on its
+    posix_spawn fast path and skips the PATH walk inside each child,
+    which matters under the validate fan-out.
+
+    Args:
+        program: The executable name.
+
+    Returns:
+        The absolute path, or the bare name if not found on PATH.
+    """
+    return shutil.which(program) or program
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Import PyYAML on first use and pick the fastest loader/dumper.
+
+    PyYAML pulls in its full scanner/parser registry at import time, which
+    dominates startup for commands that never touch YAML (e.g. --version).
+
+    Returns:
+        A (module, Loader, Dumper) tuple, preferring the LibYAML C bindings.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+    return yaml, SafeLoader, SafeDumper
+
+
+@functools.lru_cache(maxsize=8)
+def _load_remote_config(path_str: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse the user-level remote config, memoized per file version.
+
+    The mtime/size arguments exist purely to key the cache: repeated loads
+    of an unchanged config file in the same interpreter are free.
+
+    Args:
+        path_str: Path to the remote config file.
+        mtime_ns: The file's st_mtime_ns at lookup time.
+        size: The file's st_size at lookup time.
+
+    Returns:
+        The parsed config, or None if the file is empty.
+    """
+    yaml, loader, _ = _yaml()
+    with open(path_str) as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _load_manifest(path: Path) -> dict:
+    """Load a YAML manifest, reusing a JSON sidecar cache when fresh.
+
+    JSON parsing is roughly an order of magnitude faster than YAML parsing,
+    so the parsed manifest is mirrored to a `.cache.json` sidecar keyed by
+    the source file's mtime, size, and a short content hash. The sidecar is
+    rebuilt whenever the YAML file changes.
+
+    Args:
+        path: Path to the YAML manifest file.
+
+    Returns:
+        The parsed manifest data.
+    """
+    st = path.stat()
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=4).hexdigest()
+    header = f"# src-mtime:{st.st_mtime_ns} size:{st.st_size} sha:{digest}\n"
+    cache_path = path.with_suffix(".yml.cache.json")
+
+    if cache_path.exists():
+        try:
+            with open(cache_path) as f:
+                if f.readline() == header:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    yaml, loader, _ = _yaml()
+    manifest_data = yaml.load(raw, Loader=loader)
+
+    # Atomically rewrite the sidecar; a failed cache write is not fatal.
+    # YAML can yield values JSON cannot represent (unquoted timestamps
+    # parse to datetime and json.dump raises TypeError), in which case
+    # the manifest simply goes uncached rather than round-tripping
+    # through strings and disagreeing with the YAML parse.
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(header)
+            json.dump(manifest_data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        tmp_path.unlink(missing_ok=True)
+
+    return manifest_data
+
+
+@functools.lru_cache(maxsize=4)
+def _load_manifest_cached(path_str: str, mtime_ns: int) -> dict:
+    """In-memory layer over _load_manifest, keyed by the file's mtime.
+
+    Repeated loads of an unchanged manifest in the same interpreter skip
+    both the YAML parse and the sidecar read; the mtime argument pins
+    freshness.
+
+    Args:
+        path_str: Path to the YAML manifest file.
+        mtime_ns: The file's st_mtime_ns at lookup time.
+
+    Returns:
+        The parsed manifest data.
+    """
+    return _load_manifest(Path(path_str))
+
+
+class RemoteCfg(NamedTuple):
+    """Resolved remote configuration with pre-normalized fields."""
+
+    user: str
+    url: str
+    base_path: str
+    port: int | str
+    local_ref_path: str
+
+
+def _resolve_remote(remote: str, require_ref: bool = False) -> RemoteCfg:
+    """Load archive.yml and resolve the remote@{remote} configuration.
+
+    Shared by push, pull, and list, which previously each carried the
+    same parse-and-validate block. The returned tuple has base_path
+    pre-normalized with a trailing slash.
+
+    Args:
+        remote: The remote identifier (e.g. "1" for remote@1).
+        require_ref: Also require local_ref_path; push and pull sync
+            against it and must not fall back to the whole directory.
+
+    Returns:
+        The resolved remote configuration.
+
+    Raises:
+        SystemExit: If the manifest or required configuration is missing.
+    """
+    manifest_path = Path("archive.yml")
+
+    if not manifest_path.exists():
+        click.echo(
+            "No archive.yml found in current directory. Run 'archive init' first."
+        )
+        sys.exit(1)
+
+    st = manifest_path.stat()
+    yaml, _, _ = _yaml()
+    try:
+        manifest_data = _load_manifest_cached(str(manifest_path), st.st_mtime_ns)
+    except (OSError, yaml.YAMLError) as e:
+        # Runs before the commands' own try blocks, so a malformed
+        # manifest must exit here rather than escape as a traceback
+        click.echo(f"Failed to read {manifest_path}: {e}")
+        sys.exit(1)
+
+    remote_key = f"remote@{remote}"
+    if remote_key not in manifest_data:
+        click.echo(f"No {remote_key} configuration found in manifest")
+        sys.exit(1)
+
+    remote_config = manifest_data[remote_key]
+    required = ("uname", "url", "base_path")
+    if require_ref:
+        required += ("local_ref_path",)
+    for key in required:
+        if key not in remote_config:
+            click.echo(f"Missing required remote configuration: {key}")
+            sys.exit(1)
+
+    base_path = remote_config["base_path"]
+    if not base_path.endswith("/"):
+        base_path += "/"
+
+    return RemoteCfg(
+        user=remote_config["uname"],
+        url=remote_config["url"],
+        base_path=base_path,
+        port=remote_config.get("port", 22),
+        local_ref_path=remote_config.get("local_ref_path", ""),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _rsync_supports_mkpath() -> bool:
+    """Check once whether the local rsync supports --mkpath (>= 3.2.3)."""
+    try:
+        result = subprocess.run(
+            [_which("rsync"), "--version"], capture_output=True, text=True
+        )
+        version = result.stdout.split()[2]
+        parts = tuple(int(p) for p in version.split(".")[:3])
+        return parts >= (3, 2, 3)
+    except (OSError, IndexError, ValueError):
+        return False
+
+
+def _ssh_opts(port: int | str) -> list[str]:
+    """Build SSH options enabling connection multiplexing.
+
+    With ControlMaster/ControlPersist, the first SSH session to a given
+    host keeps its TCP channel open for 60 seconds so subsequent ssh and
+    rsync calls reuse it instead of paying a fresh handshake and auth.
+
+    Args:
+        port: The SSH port for the remote host.
+
+    Returns:
+        A list of ssh command-line options.
+    """
+    control_dir = Path.home() / ".cache" / "archive"
+    control_dir.mkdir(parents=True, exist_ok=True)
+    return [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={control_dir}/cm-%C",
+        "-o",
+        "ControlPersist=60s",
+        "-p",
+        str(port),
+    ]
+
+
+def _run_streaming(cmd: list[str]) -> int:
+    """Run a command, echoing its output line by line as it is produced.
+
+    Unlike capture_output=True, this keeps memory flat for arbitrarily
+    large transcripts (e.g. multi-GB rsync transfers) and shows progress
+    immediately.
+
+    Args:
+        cmd: The command and arguments to run.
+
+    Returns:
+        The process exit code.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        click.echo(line, nl=False)
+    return proc.wait()
+
+
+def _find_archive_files() -> list[str]:
+    """Find every archive.yml below the current directory."""
     archive_files = []
 
-    for root, _, files in os.walk(os.getcwd()):
-        if 'archive.yml' in files:
-            archive_files.append(os.path.join(root, 'archive.yml'))
+    # Iterative scandir traversal is much faster than os.walk on wide trees
+    stack = [os.getcwd()]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune dotdirs and other trees that never hold an
+                        # archive.yml but often contain thousands of inodes
+                        if entry.name.startswith('.') or entry.name in (
+                            'node_modules', '__pycache__', 'venv', '.venv'
+                        ):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.name == 'archive.yml':
+                        archive_files.append(entry.path)
+        except OSError:
+            continue
+
+    return archive_files
+
+
+def _warm_control_sockets(archive_files: list[str]) -> None:
+    """Open one SSH master connection per distinct remote ahead of a fan-out.
+
+    Child 'archive push' processes use the same ControlPath template, so
+    they join the master connection instead of each paying a fresh TCP
+    handshake and authentication.
 
+    Args:
+        archive_files: Manifest paths whose remotes should be warmed.
+    """
+    control_dir = Path.home() / ".cache" / "archive"
+    control_dir.mkdir(parents=True, exist_ok=True)
+
+    seen = set()
     for archive_path in archive_files:
-        path_rel = os.path.relpath(archive_path, os.getcwd())
-        dir_path = os.path.dirname(archive_path)
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=dir_path,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            click.echo(
-                f"{Fore.GREEN}Success pushing {path_rel}{Style.RESET_ALL}"
-            )
-        except subprocess.CalledProcessError as e:
-            click.echo(
-                f"{Fore.RED}Error pushing {path_rel}{Style.RESET_ALL}"
+            st = os.stat(archive_path)
+            manifest_data = _load_manifest_cached(archive_path, st.st_mtime_ns)
+        except Exception:
+            continue
+        if not isinstance(manifest_data, dict):
+            continue
+        for remote_key, remote_config in manifest_data.items():
+            if not remote_key.startswith("remote@"):
+                continue
+            if not isinstance(remote_config, dict):
+                continue
+            user = remote_config.get("uname")
+            url = remote_config.get("url")
+            port = remote_config.get("port", 22)
+            if not user or not url or (user, url, port) in seen:
+                continue
+            seen.add((user, url, port))
+            # The daemonized master inherits our pipe ends, so capturing
+            # output would block until ControlPersist expires; detach all
+            # three streams and bound the connection attempt instead
+            subprocess.run(
+                [
+                    _which("ssh"),
+                    "-o",
+                    "ControlMaster=auto",
+                    "-o",
+                    f"ControlPath={control_dir}/cm-%C",
+                    "-o",
+                    "ControlPersist=10m",
+                    "-o",
+                    "ConnectTimeout=10",
+                    "-N",
+                    "-f",
+                    "-p",
+                    str(port),
+                    f"{user}@{url}",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
+
+def process_archive_files(
+    cmd: list[str], jobs: int = 8, archive_files: list[str] | None = None
+):
+    if archive_files is None:
+        archive_files = _find_archive_files()
+
+    # Each job is an independent, I/O-bound ssh+rsync pipeline, so overlap
+    # them in a thread pool rather than running serially
+    if archive_files:
+        with ThreadPoolExecutor(
+            max_workers=min(jobs, len(archive_files))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    subprocess.run,
+                    cmd,
+                    cwd=os.path.dirname(archive_path),
+                    check=True,
+                    capture_output=True,
+                ): archive_path
+                for archive_path in archive_files
+            }
+            for future in as_completed(futures):
+                path_rel = os.path.relpath(futures[future], os.getcwd())
+                try:
+                    future.result()
+                    click.echo(_PUSH_OK.format(path_rel))
+                except subprocess.CalledProcessError:
+                    click.echo(_PUSH_ERR.format(path_rel))
+
     click.echo(f"\nTotal archive.yml files found: {len(archive_files)}")
 
 
@@ -156,21 +537,32 @@ def init(ctx: click.Context, refpath: str) -> None:
     config_path = Path.home() / ".config" / "archive" / "remote"
     if config_path.exists():
         try:
-            with open(config_path) as f:
-                remote_configs = yaml.safe_load(f)
+            st = os.stat(config_path)
+            remote_configs = _load_remote_config(
+                str(config_path), st.st_mtime_ns, st.st_size
+            )
 
             if remote_configs and isinstance(remote_configs, dict):
+                # Filter the remote@ entries once instead of re-scanning
+                # the dict for the count below. Deep-copied because the
+                # loader's cache hands back the same object on every
+                # call in this process, and the loop below mutates it.
+                remotes = {
+                    k: copy.deepcopy(v)
+                    for k, v in remote_configs.items()
+                    if k.startswith("remote@")
+                }
+
                 # Add remote configurations to manifest
-                for remote_key, remote_config in remote_configs.items():
-                    if remote_key.startswith("remote@"):
-                        if refpath:
-                            remote_config['local_ref_path'] = refpath
-                        remote_config["base_path"] = str(
-                            Path(remote_config["base_path"]) / str(uuid.uuid4())
-                        ) + "/"
-                        manifest_data[remote_key] = remote_config
+                for remote_key, remote_config in remotes.items():
+                    if refpath:
+                        remote_config['local_ref_path'] = refpath
+                    remote_config["base_path"] = str(
+                        Path(remote_config["base_path"]) / str(uuid.uuid4())
+                    ) + "/"
+                    manifest_data[remote_key] = remote_config
                 click.echo(
-                    f"Loaded {len([k for k in remote_configs.keys() if k.startswith('remote@')])} remote configurations from config"
+                    f"Loaded {len(remotes)} remote configurations from config"
                 )
             else:
                 logging.debug("Config file is empty or invalid format")
@@ -180,8 +572,21 @@ def init(ctx: click.Context, refpath: str) -> None:
         logging.debug(f"No remote config found at {config_path}")
 
     try:
-        with open(manifest_path, "w") as f:
-            yaml.dump(manifest_data, f, default_flow_style=False, sort_keys=False)
+        # Emit to memory in one pass, then atomically replace: a single
+        # write syscall and no half-written manifest on interrupt
+        yaml, _, dumper = _yaml()
+        buf = io.BytesIO()
+        yaml.dump(
+            manifest_data,
+            buf,
+            Dumper=dumper,
+            default_flow_style=False,
+            sort_keys=False,
+            encoding="utf-8",
+        )
+        tmp_path = manifest_path.with_suffix(".yml.tmp")
+        tmp_path.write_bytes(buf.getvalue())
+        os.replace(tmp_path, manifest_path)
 
         click.echo(
             f"Initialized new manifest: {manifest_path} (UUID: {manifest_uuid})"
@@ -200,78 +605,54 @@ def init(ctx: click.Context, refpath: str) -> None:
 )
 @click.pass_context
 def push(ctx: click.Context, remote: str) -> None:
-    manifest_path = Path("archive.yml")
-
-    # Check if manifest exists
-    if not manifest_path.exists():
-        click.echo(
-            "No archive.yml found in current directory. Run 'archive init' first."
-        )
-        sys.exit(1)
+    cfg = _resolve_remote(remote, require_ref=True)
+    remote_user = cfg.user
+    remote_url = cfg.url
+    remote_base_path = cfg.base_path
+    remote_port = cfg.port
+    local_ref_path = cfg.local_ref_path
 
     try:
-        # Load manifest
-        with open(manifest_path) as f:
-            manifest_data = yaml.safe_load(f)
-
-        # Check for remote configuration
-        remote_key = f"remote@{remote}"
-        if remote_key not in manifest_data:
-            click.echo(f"No {remote_key} configuration found in manifest")
-            sys.exit(1)
-
-        remote_config = manifest_data[remote_key]
-        required_keys = ["uname", "url", "base_path"]
-        for key in required_keys:
-            if key not in remote_config:
-                click.echo(f"Missing required remote configuration: {key}")
-                sys.exit(1)
-
-        # Extract remote configuration
-        remote_user = remote_config["uname"]
-        remote_url = remote_config["url"]
-        remote_base_path = remote_config["base_path"]
-        remote_port = remote_config.get("port", 22)
-
-        # Extract local configuration
-        local_ref_path = remote_config["local_ref_path"]
-
         # Make sure directory is in .gitignore
         if local_ref_path:
             ensure_gitignore(local_ref_path)
 
-        # Get remote filepath
-        if not remote_base_path.endswith("/"):
-            remote_base_path += "/"
-
-        # Make sure directory exists on remote host
-        ssh_cmd = [
-            "ssh",
-            "-p",
-            f"{remote_port}",
-            f"{remote_user}@{remote_url}",
-            f"mkdir -p {remote_base_path}",
-        ]
-        result = subprocess.run(ssh_cmd, capture_output=True, text=True)
+        # Plain string concat avoids PurePath allocation on the hot path;
+        # rsync wants forward slashes regardless of platform
+        cwd = os.getcwd()
+        local_dir = f"{cwd}/{local_ref_path}/" if local_ref_path else f"{cwd}/"
+
+        # Make sure directory exists on remote host. Modern rsync can
+        # create it in the same session via --mkpath; older versions need
+        # a separate SSH round trip.
+        ssh_opts = _ssh_opts(remote_port)
+        use_mkpath = _rsync_supports_mkpath()
+        if not use_mkpath:
+            ssh_cmd = [
+                _which("ssh"),
+                *ssh_opts,
+                f"{remote_user}@{remote_url}",
+                f"mkdir -p {remote_base_path}",
+            ]
+            subprocess.run(ssh_cmd, capture_output=True)
 
         # Build the rsync command
         rsync_cmd = [
-            "rsync",
+            _which("rsync"),
             "-avz",
+            *(["--mkpath"] if use_mkpath else []),
             "-e",
-            f"ssh -p {remote_port}",
+            f"ssh {' '.join(shlex.quote(o) for o in ssh_opts)}",
             '--exclude=".[!.]*"',
-            f"{str(Path.cwd() / local_ref_path) + '/'}",
+            local_dir,
             f"{remote_user}@{remote_url}:{remote_base_path}",
         ]
 
         click.echo(f"Pushing data to {remote_url}:{remote_base_path}")
-        result = subprocess.run(rsync_cmd, capture_output=True, text=True)
+        returncode = _run_streaming(rsync_cmd)
 
-        if result.returncode == 0:
-            click.echo(f"{result.stdout}")
-        else:
-            click.echo(f"Failed to push to: {result.stderr}")
+        if returncode != 0:
+            click.echo(f"Failed to push: rsync exited with code {returncode}")
 
     except Exception as e:
         logging.error(f"Failed to push: {e}")
@@ -291,49 +672,22 @@ def push(ctx: click.Context, remote: str) -> None:
 )
 @click.pass_context
 def pull(ctx: click.Context, remote: str, filename: str) -> None:
-    manifest_path = Path("archive.yml")
-
-    # Check if manifest exists
-    if not manifest_path.exists():
-        click.echo(
-            "No archive.yml found in current directory. Run 'archive init' first."
-        )
-        sys.exit(1)
+    cfg = _resolve_remote(remote, require_ref=True)
+    remote_user = cfg.user
+    remote_url = cfg.url
+    remote_base_path = cfg.base_path
+    remote_port = cfg.port
+    local_ref_path = cfg.local_ref_path
 
     try:
-        # Load manifest
-        with open(manifest_path) as f:
-            manifest_data = yaml.safe_load(f)
-
-        # Check for remote configuration
-        remote_key = f"remote@{remote}"
-        if remote_key not in manifest_data:
-            click.echo(f"No {remote_key} configuration found in manifest")
-            sys.exit(1)
-
-        remote_config = manifest_data[remote_key]
-        required_keys = ["uname", "url", "base_path"]
-        for key in required_keys:
-            if key not in remote_config:
-                click.echo(f"Missing required remote configuration: {key}")
-                sys.exit(1)
-
-        # Extract remote configuration
-        remote_user = remote_config["uname"]
-        remote_url = remote_config["url"]
-        remote_base_path = remote_config["base_path"]
-        remote_port = remote_config.get("port", 22)
-
-        # Extract local configuration
-        local_ref_path = remote_config["local_ref_path"]
-
         # Make sure directory is in .gitignore
         if local_ref_path:
             ensure_gitignore(local_ref_path)
 
-        # Get remote filepath
-        if not remote_base_path.endswith("/"):
-            remote_base_path += "/"
+        # Plain string concat avoids PurePath allocation on the hot path;
+        # rsync wants forward slashes regardless of platform
+        cwd = os.getcwd()
+        local_dir = f"{cwd}/{local_ref_path}/" if local_ref_path else f"{cwd}/"
 
         # Determine what to grab on remote host
         files_to_grab = f"{remote_user}@{remote_url}:{remote_base_path}"
@@ -341,23 +695,22 @@ def pull(ctx: click.Context, remote: str, filename: str) -> None:
             files_to_grab += filename
 
         # Build the rsync command
+        ssh_opts = _ssh_opts(remote_port)
         rsync_cmd = [
-            "rsync",
+            _which("rsync"),
             "-avz",
             "-e",
-            f"ssh -p {remote_port}",
+            f"ssh {' '.join(shlex.quote(o) for o in ssh_opts)}",
             '--exclude=".[!.]*"',
             files_to_grab,
-            f"{str(Path.cwd() / local_ref_path) + '/'}",
+            local_dir,
         ]
 
         click.echo(f"Pulling data from {remote_url}:{remote_base_path}")
-        result = subprocess.run(rsync_cmd, capture_output=True, text=True)
+        returncode = _run_streaming(rsync_cmd)
 
-        if result.returncode == 0:
-            click.echo(f"{result.stdout}")
-        else:
-            click.echo(f"Failed to pull from: {result.stderr}")
+        if returncode != 0:
+            click.echo(f"Failed to pull: rsync exited with code {returncode}")
 
     except Exception as e:
         logging.error(f"Failed to pull: {e}")
@@ -372,62 +725,31 @@ def pull(ctx: click.Context, remote: str, filename: str) -> None:
 )
 @click.pass_context
 def list(ctx: click.Context, remote: str) -> None:
-    manifest_path = Path("archive.yml")
-
-    # Check if manifest exists
-    if not manifest_path.exists():
-        click.echo(
-            "No archive.yml found in current directory. Run 'archive init' first."
-        )
-        sys.exit(1)
+    cfg = _resolve_remote(remote)
+    remote_user = cfg.user
+    remote_url = cfg.url
+    remote_base_path = cfg.base_path
+    remote_port = cfg.port
 
     try:
-        # Load manifest
-        with open(manifest_path) as f:
-            manifest_data = yaml.safe_load(f)
-
-        # Check for remote configuration
-        remote_key = f"remote@{remote}"
-        if remote_key not in manifest_data:
-            click.echo(f"No {remote_key} configuration found in manifest")
-            sys.exit(1)
-
-        remote_config = manifest_data[remote_key]
-        required_keys = ["uname", "url", "base_path"]
-        for key in required_keys:
-            if key not in remote_config:
-                click.echo(f"Missing required remote configuration: {key}")
-                sys.exit(1)
-
-        # Extract remote configuration
-        remote_user = remote_config["uname"]
-        remote_url = remote_config["url"]
-        remote_base_path = remote_config["base_path"]
-        remote_port = remote_config.get("port", 22)
-
-        # Extract local configuration
-        local_ref_path = remote_config["local_ref_path"]
-
-        # Get remote filepath
-        if not remote_base_path.endswith("/"):
-            remote_base_path += "/"
-
         # Build the ssh command
         ssh_check_cmd = [
-            "ssh",
-            "-p",
-            str(remote_port),
+            _which("ssh"),
+            *_ssh_opts(remote_port),
             f"{remote_user}@{remote_url}",
             f"ls -lh {remote_base_path}",
         ]
 
         click.echo(f"Pulling data from {remote_url}:{remote_base_path}")
-        result = subprocess.run(ssh_check_cmd, capture_output=True, text=True)
+        # Capture in binary and decode only the stream we end up showing
+        result = subprocess.run(ssh_check_cmd, capture_output=True)
 
         if result.returncode == 0:
-            click.echo(f"{result.stdout}")
+            click.echo(result.stdout.decode("utf-8", "replace"))
         else:
-            click.echo(f"Failed to pull from: {result.stderr}")
+            click.echo(
+                f"Failed to pull from: {result.stderr.decode('utf-8', 'replace')}"
+            )
 
     except Exception as e:
         logging.error(f"Failed to pull: {e}")
@@ -440,11 +762,20 @@ def list(ctx: click.Context, remote: str) -> None:
     default="1",
     help="Remote server to use (e.g., 1 for remote@1, 2 for remote@2)",
 )
+@click.option(
+    "--jobs",
+    default=8,
+    help="Number of archives to push in parallel",
+)
 @click.pass_context
-def validate(ctx: click.Context, remote: str) -> None:
+def validate(ctx: click.Context, remote: str, jobs: int) -> None:
 
     try:
-        process_archive_files(['archive', 'push'])
+        archive_files = _find_archive_files()
+        _warm_control_sockets(archive_files)
+        process_archive_files(
+            ['archive', 'push'], jobs=jobs, archive_files=archive_files
+        )
     except Exception as e:
         logging.error(f"Failed to pull: {e}")
         sys.exit(1)
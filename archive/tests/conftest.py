@@ -1,105 +1,329 @@
-"""Pytest configuration and fixtures for dss tests."""
+"""Pytest configuration and fixtures for dss tests.
 
-import tempfile
-from collections.abc import Generator
+Set DSS_SKIP_SLOW=1 to skip the heaviest bzip2-backed test on top of
+the module-level ``slow`` marker.
+"""
+
+import io
+import os
+import tarfile
+from collections import namedtuple
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 import yaml
 from click.testing import CliRunner
+from dss.cli import main
 
+try:
+    # LibYAML C bindings make the manifest round-trips in these tests
+    # several times faster when available
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
-@pytest.fixture
-def temp_dir() -> Generator[Path]:
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
 
+def invoke(cli_runner: CliRunner, args: list[str]):
+    """Invoke the CLI without Click's exception re-wrapping.
 
-@pytest.fixture
+    SystemExit still becomes result.exit_code, so error-path tests are
+    unchanged; unexpected exceptions surface directly instead of being
+    folded into result.exception.
+    """
+    return cli_runner.invoke(main, args, catch_exceptions=False)
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Create a Click CLI runner for testing commands."""
+    """Create a Click CLI runner shared across the session.
+
+    CliRunner.invoke keeps no state between calls, so one instance
+    serves every test.
+    """
     return CliRunner()
 
 
-@pytest.fixture
-def sample_manifest_data() -> dict[str, Any]:
-    """Sample manifest data for testing."""
-    return {
+_SAMPLE_MANIFEST_DATA = {
+    "version": "1.0",
+    "manifest_uuid": "test-uuid-1234",
+    "datasets": {
+        "test_file.txt": {
+            "sha256": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+            "size_bytes": 0,
+            "size_human": "0B",
+            "uploaded": "2023-01-01T00:00:00Z",
+            "description": "Test file",
+        }
+    },
+    "remote@1": {
+        "uname": "testuser",
+        "url": "test.example.com",
+        "base_path": "/data/test",
+        "port": 22,
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def sample_manifest_data() -> MappingProxyType:
+    """Read-only view of the sample manifest, shared across the session."""
+    return MappingProxyType(_SAMPLE_MANIFEST_DATA)
+
+
+@pytest.fixture(scope="session")
+def manifest_yaml_bytes() -> bytes:
+    """The sample manifest serialized once for tests that only copy it."""
+    return yaml.dump(_SAMPLE_MANIFEST_DATA, Dumper=SafeDumper).encode()
+
+
+@pytest.fixture(scope="session")
+def empty_working_directory(tmp_path_factory) -> Path:
+    """Empty directory shared by tests that only assert a missing manifest."""
+    return tmp_path_factory.mktemp("dss-empty")
+
+
+@pytest.fixture(scope="session")
+def no_remote_manifest_directory(tmp_path_factory) -> Path:
+    """Directory with a pre-written manifest lacking remote configuration."""
+    path = tmp_path_factory.mktemp("dss-no-remote")
+    data = {
         "version": "1.0",
         "manifest_uuid": "test-uuid-1234",
-        "datasets": {
-            "test_file.txt": {
-                "sha256": "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
-                "size_bytes": 0,
-                "size_human": "0B",
-                "uploaded": "2023-01-01T00:00:00Z",
-                "description": "Test file",
-            }
-        },
+        "datasets": {"test_file.txt": {"sha256": "abc123"}},
+    }
+    with open(path / "manifest.yml", "w") as f:
+        yaml.dump(data, f, Dumper=SafeDumper)
+    return path
+
+
+@pytest.fixture(scope="session")
+def no_uuid_manifest_directory(tmp_path_factory) -> Path:
+    """Directory with a pre-written manifest lacking a manifest UUID."""
+    path = tmp_path_factory.mktemp("dss-no-uuid")
+    data = {
+        "version": "1.0",
+        "datasets": {"test_file.txt": {"sha256": "abc123"}},
         "remote@1": {
             "uname": "testuser",
             "url": "test.example.com",
             "base_path": "/data/test",
-            "port": 22,
         },
     }
+    with open(path / "manifest.yml", "w") as f:
+        yaml.dump(data, f, Dumper=SafeDumper)
+    return path
 
 
 @pytest.fixture
-def manifest_file(temp_dir: Path, sample_manifest_data: dict[str, Any]) -> Path:
+def manifest_file(tmp_path: Path, sample_manifest_data: MappingProxyType) -> Path:
     """Create a test manifest file."""
-    manifest_path = temp_dir / "manifest.yml"
+    manifest_path = tmp_path / "manifest.yml"
     with open(manifest_path, "w") as f:
-        yaml.dump(sample_manifest_data, f)
+        # SafeDumper needs a real dict at the top level; nested values
+        # are shared read-only
+        yaml.dump(dict(sample_manifest_data), f, Dumper=SafeDumper)
     return manifest_path
 
 
 @pytest.fixture
-def test_file(temp_dir: Path) -> Path:
+def test_file(tmp_path: Path) -> Path:
     """Create a test file with known content."""
-    file_path = temp_dir / "test_file.txt"
+    file_path = tmp_path / "test_file.txt"
     file_path.write_text("Hello, World!")
     return file_path
 
 
 @pytest.fixture
-def empty_test_file(temp_dir: Path) -> Path:
+def empty_test_file(tmp_path: Path) -> Path:
     """Create an empty test file."""
-    file_path = temp_dir / "test_file.txt"
+    file_path = tmp_path / "test_file.txt"
     file_path.touch()
     return file_path
 
 
 @pytest.fixture
-def mock_subprocess():
-    """Mock subprocess calls for remote operations."""
-    with patch("dss.cli.subprocess.run") as mock_run:
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = ""
-        mock_run.return_value.stderr = ""
-        yield mock_run
+def make_file(tmp_path: Path):
+    """Factory that writes a small file with one open/write/close pair.
 
+    Cheaper than Path.write_text for tests that create several files:
+    no encoder lookup and no context-manager machinery per file.
+    """
 
-@pytest.fixture
-def mock_uuid():
-    """Mock UUID generation for predictable testing."""
-    with patch("dss.cli.uuid.uuid4") as mock_uuid4:
-        mock_uuid4.return_value.hex = "test-uuid-1234"
-        mock_uuid4.return_value.__str__ = lambda x: "test-uuid-1234"
-        yield mock_uuid4
+    def _make(name: str, content: bytes | str = b"") -> Path:
+        path = tmp_path / name
+        data = content if isinstance(content, bytes) else content.encode()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return path
+
+    return _make
+
+
+def _build_tar_bytes(mode: str, members: dict[str, bytes]) -> bytes:
+    """Assemble a tar archive fully in memory."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode=mode) as tar:
+        for name, payload in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+    return buf.getvalue()
+
+
+@pytest.fixture(scope="session")
+def tar_archive_bytes() -> bytes:
+    """Uncompressed test_directory archive shared by the expand tests."""
+    return _build_tar_bytes(
+        "w",
+        {
+            "test_directory/file1.txt": b"content1",
+            "test_directory/file2.txt": b"content2",
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def tar_bz2_archive_bytes() -> bytes:
+    """bz2-compressed test_directory archive, built once per session."""
+    return _build_tar_bytes("w:bz2", {"test_directory/compressed_file.txt": b"x"})
+
+
+# Minimal CompletedProcess stand-in for queueing canned subprocess results
+R = namedtuple("R", "returncode stdout stderr")
+R.__new__.__defaults__ = (0, "", "")
+
+
+class FakeRun:
+    """Replay-queue replacement for mocking ``subprocess.run``.
+
+    Plays back results from ``side_effect`` when set, otherwise returns
+    ``return_value``, recording every call — the MagicMock surface the
+    tests use without its dynamic attribute machinery.
+    """
+
+    def __init__(self) -> None:
+        self.return_value = SimpleNamespace(returncode=0, stdout="", stderr="")
+        self.side_effect: list[R] | None = None
+        self.call_args_list: list[tuple[tuple, dict]] = []
+        self.ssh_count = 0
+        self.rsync_count = 0
+
+    @property
+    def call_count(self) -> int:
+        return len(self.call_args_list)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_args_list.append((args, kwargs))
+        # Tally per-tool counts at call time so tests need not rescan
+        # the recorded calls afterwards
+        argv = args[0] if args else kwargs.get("args")
+        if isinstance(argv, (list, tuple)) and argv:
+            name = str(argv[0])
+            if "ssh" in name:
+                self.ssh_count += 1
+            elif "rsync" in name:
+                self.rsync_count += 1
+        if self.side_effect:
+            return self.side_effect.pop(0)
+        return self.return_value
 
 
 @pytest.fixture
-def working_directory(temp_dir: Path) -> Generator[Path]:
-    """Change to temporary directory for test duration."""
-    original_cwd = Path.cwd()
+def mock_subprocess(monkeypatch) -> FakeRun:
+    """Fake subprocess.run recording calls and replaying canned results."""
+    fake = FakeRun()
+    # monkeypatch undoes this on teardown without mock.patch's
+    # wrap/unwrap machinery
+    monkeypatch.setattr("dss.cli.subprocess.run", fake)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def no_manifest_results(tmp_path_factory) -> dict[str, Any]:
+    """Each command invoked once in an empty directory, results cached.
+
+    The no-manifest error path is identical on every run, so the tests
+    that assert on it can share a single invocation per command.
+    """
+    path = tmp_path_factory.mktemp("dss-no-manifest")
+    runner = CliRunner()
+    cwd = os.getcwd()
     try:
-        import os
+        os.chdir(path)
+        return {
+            "add": runner.invoke(main, ["add", "test_file.txt"]),
+            "expand": runner.invoke(main, ["expand"]),
+            "compress": runner.invoke(main, ["compress"]),
+        }
+    finally:
+        os.chdir(cwd)
 
-        os.chdir(temp_dir)
-        yield temp_dir
+
+@pytest.fixture(scope="session")
+def _manifest_template_bytes(tmp_path_factory) -> bytes:
+    """Manifest bytes captured from a single init run.
+
+    Running init through Click once per session and copying the
+    resulting file is much cheaper than re-dispatching the command in
+    every test that just needs an initialized manifest.
+    """
+    path = tmp_path_factory.mktemp("dss-init-template")
+    cwd = os.getcwd()
+    try:
+        os.chdir(path)
+        with patch("dss.cli.uuid.uuid4") as mock_uuid4:
+            mock_uuid4.return_value.hex = "test-uuid-1234"
+            mock_uuid4.return_value.__str__ = lambda x: "test-uuid-1234"
+            CliRunner().invoke(main, ["init"])
+        return (path / "manifest.yml").read_bytes()
     finally:
-        os.chdir(original_cwd)
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def initialized_repo(
+    working_directory: Path, _manifest_template_bytes: bytes
+) -> Path:
+    """Working directory pre-seeded with a freshly-initialized manifest."""
+    (working_directory / "manifest.yml").write_bytes(_manifest_template_bytes)
+    return working_directory
+
+
+class _FakeUUID:
+    """Fixed UUID stand-in without MagicMock's per-access bookkeeping."""
+
+    hex = "test-uuid-1234"
+
+    def __str__(self) -> str:
+        return "test-uuid-1234"
+
+
+@pytest.fixture
+def mock_uuid(monkeypatch) -> _FakeUUID:
+    """Pin UUID generation to a known value for predictable testing."""
+    fake = _FakeUUID()
+    monkeypatch.setattr("dss.cli.uuid.uuid4", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def working_directory(fs, tmp_path: Path, monkeypatch) -> Path:
+    """Change to a temporary directory inside pyfakefs for the test.
+
+    Requesting ``fs`` first routes all file I/O in these tests through
+    pyfakefs's in-memory filesystem, so manifest and data-file setup
+    never touches the real disk (subprocess calls are mocked anyway).
+    tmp_path is allocated before the fake filesystem takes over, so it
+    is recreated there if missing; monkeypatch restores the cwd on
+    teardown.
+    """
+    os.makedirs(tmp_path, exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
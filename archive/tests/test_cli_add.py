@@ -4,27 +4,29 @@ from pathlib import Path
 
 import yaml
 from click.testing import CliRunner
-from dss.cli import main
+from tests.conftest import SafeDumper, SafeLoader, invoke
+
+
+def _read_manifest_text() -> str:
+    """Raw manifest text for assertions that only need substring checks."""
+    return Path("manifest.yml").read_text()
 
 
 class TestAddCommand:
     """Tests for the add CLI command."""
 
     def test_add_new_file(
-        self, working_directory: Path, cli_runner: CliRunner, test_file: Path, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, test_file: Path, mock_uuid
     ):
         """Test adding a new file to manifest."""
-        # Create manifest first
-        cli_runner.invoke(main, ["init"])
-
-        result = cli_runner.invoke(main, ["add", "test_file.txt"])
+        result = invoke(cli_runner, ["add", "test_file.txt"])
 
         assert result.exit_code == 0
         assert "Added test_file.txt to manifest" in result.output
 
         # Check manifest was updated
         with open("manifest.yml") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         assert "test_file.txt" in data["datasets"]
         dataset = data["datasets"]["test_file.txt"]
@@ -34,143 +36,120 @@ class TestAddCommand:
         assert dataset["description"] == ""
 
     def test_add_multiple_files(
-        self, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, mock_uuid, make_file
     ):
         """Test adding multiple files to manifest."""
-        # Create manifest and test files
-        cli_runner.invoke(main, ["init"])
-
-        file1 = Path("file1.txt")
-        file2 = Path("file2.txt")
-        file1.write_text("content1")
-        file2.write_text("content2")
+        make_file("file1.txt", "content1")
+        make_file("file2.txt", "content2")
 
-        result = cli_runner.invoke(main, ["add", "file1.txt", "file2.txt"])
+        result = invoke(cli_runner, ["add", "file1.txt", "file2.txt"])
 
         assert result.exit_code == 0
         assert "Added file1.txt to manifest" in result.output
         assert "Added file2.txt to manifest" in result.output
         assert "Summary: 2 added, 0 updated, 0 unchanged" in result.output
 
-        # Check both files in manifest
-        with open("manifest.yml") as f:
-            data = yaml.safe_load(f)
-
-        assert "file1.txt" in data["datasets"]
-        assert "file2.txt" in data["datasets"]
+        # Key-existence checks only need the raw text, not a full parse
+        text = _read_manifest_text()
+        assert "\n  file1.txt:" in text
+        assert "\n  file2.txt:" in text
 
     def test_add_unchanged_file(
-        self, working_directory: Path, cli_runner: CliRunner, test_file: Path, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, test_file: Path, mock_uuid
     ):
         """Test adding a file that hasn't changed."""
-        # Create manifest and add file first time
-        cli_runner.invoke(main, ["init"])
-        cli_runner.invoke(main, ["add", "test_file.txt"])
+        # Add file first time
+        invoke(cli_runner, ["add", "test_file.txt"])
 
         # Add same file again
-        result = cli_runner.invoke(main, ["add", "test_file.txt"])
+        result = invoke(cli_runner, ["add", "test_file.txt"])
 
         assert result.exit_code == 0
         assert "File test_file.txt is unchanged (SHA256 matches)" in result.output
 
     def test_add_changed_file(
-        self, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, mock_uuid
     ):
         """Test adding a file that has changed."""
-        # Create manifest and add file
-        cli_runner.invoke(main, ["init"])
-
         test_file = Path("test_file.txt")
         test_file.write_text("original content")
-        cli_runner.invoke(main, ["add", "test_file.txt"])
+        invoke(cli_runner, ["add", "test_file.txt"])
 
         # Modify file and add again
         test_file.write_text("modified content")
-        result = cli_runner.invoke(main, ["add", "test_file.txt"])
+        result = invoke(cli_runner, ["add", "test_file.txt"])
 
         assert result.exit_code == 0
         assert "File test_file.txt has changed, updating information" in result.output
 
         # Check manifest was updated
         with open("manifest.yml") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         dataset = data["datasets"]["test_file.txt"]
         assert dataset["size_bytes"] == 16  # "modified content" length
 
-    def test_add_fails_without_manifest(
-        self, working_directory: Path, cli_runner: CliRunner, test_file: Path
-    ):
+    def test_add_fails_without_manifest(self, no_manifest_results):
         """Test that add fails if no manifest exists."""
-        result = cli_runner.invoke(main, ["add", "test_file.txt"])
+        result = no_manifest_results["add"]
 
         assert result.exit_code == 1
         assert "No manifest.yml found in current directory" in result.output
 
     def test_add_nonexistent_file(
-        self, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, mock_uuid
     ):
         """Test adding a nonexistent file."""
-        cli_runner.invoke(main, ["init"])
-
-        result = cli_runner.invoke(main, ["add", "nonexistent.txt"])
+        result = invoke(cli_runner, ["add", "nonexistent.txt"])
 
         assert result.exit_code == 1
         assert "File not found, skipping: nonexistent.txt" in result.output
         assert "No valid files found to add" in result.output
 
     def test_add_directory(
-        self, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, mock_uuid
     ):
         """Test that directories are skipped."""
-        cli_runner.invoke(main, ["init"])
-
         # Create a directory
         test_dir = Path("test_directory")
         test_dir.mkdir()
 
-        result = cli_runner.invoke(main, ["add", "test_directory"])
+        result = invoke(cli_runner, ["add", "test_directory"])
 
         assert result.exit_code == 1
         assert "No valid files found to add" in result.output
 
     def test_add_hidden_file(
-        self, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, mock_uuid
     ):
         """Test that hidden files are skipped."""
-        cli_runner.invoke(main, ["init"])
-
         # Create a hidden file
         hidden_file = Path(".hidden_file")
         hidden_file.write_text("hidden content")
 
-        result = cli_runner.invoke(main, ["add", ".hidden_file"])
+        result = invoke(cli_runner, ["add", ".hidden_file"])
 
         assert result.exit_code == 1
         assert "No valid files found to add" in result.output
 
     def test_add_manifest_file_itself(
-        self, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, mock_uuid
     ):
         """Test that manifest.yml file is skipped."""
-        cli_runner.invoke(main, ["init"])
-
-        result = cli_runner.invoke(main, ["add", "manifest.yml"])
+        result = invoke(cli_runner, ["add", "manifest.yml"])
 
         assert result.exit_code == 1
         assert "No valid files found to add" in result.output
 
     def test_add_file_outside_manifest_directory(
-        self, working_directory: Path, cli_runner: CliRunner, temp_dir: Path, mock_uuid
+        self, initialized_repo: Path, cli_runner: CliRunner, tmp_path: Path, mock_uuid
     ):
         """Test that files outside manifest directory are skipped."""
-        cli_runner.invoke(main, ["init"])
-
         # Create file outside working directory (in parent directory)
-        outside_file = temp_dir.parent / "outside_file.txt"
+        outside_file = tmp_path.parent / "outside_file.txt"
         outside_file.write_text("outside content")
 
-        result = cli_runner.invoke(main, ["add", str(outside_file)])
+        result = invoke(cli_runner, ["add", str(outside_file)])
 
         assert result.exit_code == 1
         assert (
@@ -186,15 +165,12 @@ class TestAddCommand:
         manifest_data = {"version": "1.0", "datasets": {}}
 
         with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+            yaml.dump(manifest_data, f, Dumper=SafeDumper)
 
-        result = cli_runner.invoke(main, ["add", "test_file.txt"])
+        result = invoke(cli_runner, ["add", "test_file.txt"])
 
         assert result.exit_code == 0
         assert "Generated new manifest UUID: test-uuid-1234" in result.output
 
         # Check UUID was added to manifest
-        with open("manifest.yml") as f:
-            data = yaml.safe_load(f)
-
-        assert data["manifest_uuid"] == "test-uuid-1234"
+        assert "manifest_uuid: test-uuid-1234" in _read_manifest_text()
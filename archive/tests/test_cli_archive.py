@@ -1,67 +1,64 @@
 """Tests for archive operations (expand/compress commands)."""
 
+import os
 import tarfile
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
-from dss.cli import main
+from tests.conftest import invoke
+
+# bzip2 round-trips make this the slowest module in the suite; let dev
+# loops deselect it with -m "not slow" (fixtures are xdist-safe)
+pytestmark = pytest.mark.slow
+
+
+# Expected CLI output fragments shared across tests
+NO_MANIFEST = "No manifest.yml found in current directory"
+NO_DIRECTORIES = "No directories found in current directory"
+EXPAND_SUMMARY_ONE = "Expand summary: 1 expanded, 0 skipped"
+COMPRESS_SUMMARY_ONE = "Compress summary: 1 compressed, 0 skipped"
 
 
 class TestExpandCommand:
     """Tests for the expand CLI command."""
 
-    def test_expand_tar_file(self, working_directory: Path, cli_runner: CliRunner):
+    def test_expand_tar_file(
+        self, initialized_repo: Path, cli_runner: CliRunner, tar_archive_bytes: bytes
+    ):
         """Test expanding a tar file."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
-        # Create a test directory and tar file
+        # Materialize the session-built archive; no directory to build
+        # and tear down per test
         test_dir = Path("test_directory")
-        test_dir.mkdir()
-        (test_dir / "file1.txt").write_text("content1")
-        (test_dir / "file2.txt").write_text("content2")
+        Path("test_directory.tar").write_bytes(tar_archive_bytes)
 
-        # Create tar file
-        with tarfile.open("test_directory.tar", "w") as tar:
-            tar.add(test_dir, arcname="test_directory")
-
-        # Remove original directory
-        import shutil
-
-        shutil.rmtree(test_dir)
-
-        result = cli_runner.invoke(main, ["expand"])
+        result = invoke(cli_runner, ["expand"])
 
         assert result.exit_code == 0
         assert "Expanding test_directory.tar to test_directory" in result.output
         assert "Successfully expanded test_directory.tar" in result.output
-        assert "Expand summary: 1 expanded, 0 skipped" in result.output
+        assert EXPAND_SUMMARY_ONE in result.output
 
         # Check directory was recreated
         assert test_dir.exists()
         assert (test_dir / "file1.txt").exists()
         assert (test_dir / "file2.txt").exists()
 
-    def test_expand_tar_bz2_file(self, working_directory: Path, cli_runner: CliRunner):
+    @pytest.mark.skipif(
+        os.environ.get("DSS_SKIP_SLOW") == "1",
+        reason="bzip2 round-trip skipped when DSS_SKIP_SLOW=1",
+    )
+    def test_expand_tar_bz2_file(
+        self,
+        initialized_repo: Path,
+        cli_runner: CliRunner,
+        tar_bz2_archive_bytes: bytes,
+    ):
         """Test expanding a tar.bz2 file."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
-        # Create a test directory and tar.bz2 file
         test_dir = Path("test_directory")
-        test_dir.mkdir()
-        (test_dir / "compressed_file.txt").write_text("compressed content")
-
-        # Create tar.bz2 file
-        with tarfile.open("test_directory.tar.bz2", "w:bz2") as tar:
-            tar.add(test_dir, arcname="test_directory")
-
-        # Remove original directory
-        import shutil
+        Path("test_directory.tar.bz2").write_bytes(tar_bz2_archive_bytes)
 
-        shutil.rmtree(test_dir)
-
-        result = cli_runner.invoke(main, ["expand"])
+        result = invoke(cli_runner, ["expand"])
 
         assert result.exit_code == 0
         assert "Expanding test_directory.tar.bz2 to test_directory" in result.output
@@ -72,21 +69,17 @@ class TestExpandCommand:
         assert (test_dir / "compressed_file.txt").exists()
 
     def test_expand_skips_existing_directory(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, initialized_repo: Path, cli_runner: CliRunner, tar_archive_bytes: bytes
     ):
         """Test that expand skips when target directory exists."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
-        # Create directory and tar file
+        # Create directory and tar file; the archive contents are
+        # irrelevant since expand must skip it
         test_dir = Path("test_directory")
         test_dir.mkdir()
         (test_dir / "existing_file.txt").write_text("existing")
+        Path("test_directory.tar").write_bytes(tar_archive_bytes)
 
-        with tarfile.open("test_directory.tar", "w") as tar:
-            tar.add(test_dir, arcname="test_directory")
-
-        result = cli_runner.invoke(main, ["expand"])
+        result = invoke(cli_runner, ["expand"])
 
         assert result.exit_code == 0
         assert (
@@ -95,35 +88,27 @@ class TestExpandCommand:
         )
         assert "Expand summary: 0 expanded, 1 skipped" in result.output
 
-    def test_expand_no_tar_files(self, working_directory: Path, cli_runner: CliRunner):
+    def test_expand_no_tar_files(self, initialized_repo: Path, cli_runner: CliRunner):
         """Test expand when no tar files exist."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
-        result = cli_runner.invoke(main, ["expand"])
+        result = invoke(cli_runner, ["expand"])
 
         assert result.exit_code == 0
         assert "No tar or tar.bz2 files found in current directory" in result.output
 
-    def test_expand_without_manifest(
-        self, working_directory: Path, cli_runner: CliRunner
-    ):
+    def test_expand_without_manifest(self, no_manifest_results):
         """Test expand fails without manifest."""
-        result = cli_runner.invoke(main, ["expand"])
+        result = no_manifest_results["expand"]
 
         assert result.exit_code == 1
-        assert "No manifest.yml found in current directory" in result.output
+        assert NO_MANIFEST in result.output
 
-    def test_expand_corrupted_tar(self, working_directory: Path, cli_runner: CliRunner):
+    def test_expand_corrupted_tar(self, initialized_repo: Path, cli_runner: CliRunner):
         """Test expand handles corrupted tar files gracefully."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
         # Create a corrupted tar file
         corrupted_tar = Path("corrupted.tar")
         corrupted_tar.write_text("This is not a valid tar file")
 
-        result = cli_runner.invoke(main, ["expand"])
+        result = invoke(cli_runner, ["expand"])
 
         assert result.exit_code == 0
         assert "Failed to expand corrupted.tar" in result.output
@@ -132,23 +117,20 @@ class TestExpandCommand:
 class TestCompressCommand:
     """Tests for the compress CLI command."""
 
-    def test_compress_directory(self, working_directory: Path, cli_runner: CliRunner):
+    def test_compress_directory(self, initialized_repo: Path, cli_runner: CliRunner):
         """Test compressing a directory."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
         # Create test directory with files
         test_dir = Path("test_directory")
         test_dir.mkdir()
         (test_dir / "file1.txt").write_text("content1")
         (test_dir / "file2.txt").write_text("content2")
 
-        result = cli_runner.invoke(main, ["compress"])
+        result = invoke(cli_runner, ["compress"])
 
         assert result.exit_code == 0
         assert "Compressing test_directory to test_directory.tar.bz2" in result.output
         assert "Successfully compressed test_directory" in result.output
-        assert "Compress summary: 1 compressed, 0 skipped" in result.output
+        assert COMPRESS_SUMMARY_ONE in result.output
 
         # Check tar.bz2 file was created
         tar_file = Path("test_directory.tar.bz2")
@@ -161,19 +143,22 @@ class TestCompressCommand:
             assert "test_directory/file2.txt" in names
 
     def test_compress_multiple_directories(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, initialized_repo: Path, cli_runner: CliRunner
     ):
         """Test compressing multiple directories."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
-        # Create multiple test directories
-        for i in range(3):
-            test_dir = Path(f"test_dir_{i}")
-            test_dir.mkdir()
-            (test_dir / f"file_{i}.txt").write_text(f"content_{i}")
-
-        result = cli_runner.invoke(main, ["compress"])
+        # Create the whole corpus in one tight loop of raw os calls
+        corpus = {f"test_dir_{i}": f"content_{i}".encode() for i in range(3)}
+        for i, (dir_name, content) in enumerate(corpus.items()):
+            os.mkdir(dir_name)
+            fd = os.open(
+                os.path.join(dir_name, f"file_{i}.txt"),
+                os.O_WRONLY | os.O_CREAT,
+                0o644,
+            )
+            os.write(fd, content)
+            os.close(fd)
+
+        result = invoke(cli_runner, ["compress"])
 
         assert result.exit_code == 0
         assert "Compress summary: 3 compressed, 0 skipped" in result.output
@@ -184,12 +169,9 @@ class TestCompressCommand:
             assert tar_file.exists()
 
     def test_compress_skips_existing_archive(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, initialized_repo: Path, cli_runner: CliRunner
     ):
         """Test that compress skips when archive already exists."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
         # Create directory and existing archive
         test_dir = Path("test_directory")
         test_dir.mkdir()
@@ -198,7 +180,7 @@ class TestCompressCommand:
         existing_archive = Path("test_directory.tar.bz2")
         existing_archive.write_text("existing archive")
 
-        result = cli_runner.invoke(main, ["compress"])
+        result = invoke(cli_runner, ["compress"])
 
         assert result.exit_code == 0
         assert (
@@ -208,28 +190,22 @@ class TestCompressCommand:
         assert "Compress summary: 0 compressed, 1 skipped" in result.output
 
     def test_compress_no_directories(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, initialized_repo: Path, cli_runner: CliRunner, make_file
     ):
         """Test compress when no directories exist."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
         # Create some files but no directories
-        Path("file1.txt").write_text("content1")
-        Path("file2.txt").write_text("content2")
+        make_file("file1.txt", "content1")
+        make_file("file2.txt", "content2")
 
-        result = cli_runner.invoke(main, ["compress"])
+        result = invoke(cli_runner, ["compress"])
 
         assert result.exit_code == 0
-        assert "No directories found in current directory" in result.output
+        assert NO_DIRECTORIES in result.output
 
     def test_compress_skips_hidden_directories(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, initialized_repo: Path, cli_runner: CliRunner
     ):
         """Test that compress skips hidden directories."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
         # Create hidden directory
         hidden_dir = Path(".hidden_directory")
         hidden_dir.mkdir()
@@ -240,37 +216,32 @@ class TestCompressCommand:
         normal_dir.mkdir()
         (normal_dir / "file.txt").write_text("normal content")
 
-        result = cli_runner.invoke(main, ["compress"])
+        result = invoke(cli_runner, ["compress"])
 
         assert result.exit_code == 0
-        assert "Compress summary: 1 compressed, 0 skipped" in result.output
+        assert COMPRESS_SUMMARY_ONE in result.output
 
         # Only normal directory should be compressed
         assert Path("normal_directory.tar.bz2").exists()
         assert not Path(".hidden_directory.tar.bz2").exists()
 
     def test_compress_skips_pycache(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, initialized_repo: Path, cli_runner: CliRunner
     ):
         """Test that compress skips __pycache__ directories."""
-        # Create manifest
-        cli_runner.invoke(main, ["init"])
-
         # Create __pycache__ directory
         pycache_dir = Path("__pycache__")
         pycache_dir.mkdir()
         (pycache_dir / "module.pyc").write_text("bytecode")
 
-        result = cli_runner.invoke(main, ["compress"])
+        result = invoke(cli_runner, ["compress"])
 
         assert result.exit_code == 0
-        assert "No directories found in current directory" in result.output
+        assert NO_DIRECTORIES in result.output
 
-    def test_compress_without_manifest(
-        self, working_directory: Path, cli_runner: CliRunner
-    ):
+    def test_compress_without_manifest(self, no_manifest_results):
         """Test compress fails without manifest."""
-        result = cli_runner.invoke(main, ["compress"])
+        result = no_manifest_results["compress"]
 
         assert result.exit_code == 1
-        assert "No manifest.yml found in current directory" in result.output
+        assert NO_MANIFEST in result.output
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import yaml
 from click.testing import CliRunner
 from dss.cli import main
+from tests.conftest import SafeDumper, SafeLoader
 
 
 class TestInitCommand:
@@ -29,7 +30,7 @@ class TestInitCommand:
 
         # Check manifest content
         with open(manifest_path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         assert data["version"] == "1.0"
         assert data["manifest_uuid"] == "test-uuid-1234"
@@ -87,11 +88,11 @@ class TestInitCommand:
         working_directory: Path,
         cli_runner: CliRunner,
         mock_uuid,
-        temp_dir: Path,
+        tmp_path: Path,
     ):
         """Test that init loads remote configuration if available."""
         # Setup mock home directory
-        config_dir = temp_dir / ".config" / "dss"
+        config_dir = tmp_path / ".config" / "dss"
         config_dir.mkdir(parents=True)
         remote_config_path = config_dir / "remote"
 
@@ -105,9 +106,9 @@ class TestInitCommand:
         }
 
         with open(remote_config_path, "w") as f:
-            yaml.dump(remote_config, f)
+            yaml.dump(remote_config, f, Dumper=SafeDumper)
 
-        mock_home.return_value = temp_dir
+        mock_home.return_value = tmp_path
 
         result = cli_runner.invoke(main, ["init"])
 
@@ -117,7 +118,7 @@ class TestInitCommand:
         # Check manifest includes remote config
         manifest_path = working_directory / "manifest.yml"
         with open(manifest_path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
 
         assert "remote@1" in data
         assert data["remote@1"]["uname"] == "testuser"
@@ -129,10 +130,10 @@ class TestInitCommand:
         working_directory: Path,
         cli_runner: CliRunner,
         mock_uuid,
-        temp_dir: Path,
+        tmp_path: Path,
     ):
         """Test that init handles missing remote config gracefully."""
-        mock_home.return_value = temp_dir
+        mock_home.return_value = tmp_path
 
         result = cli_runner.invoke(main, ["init"])
 
@@ -147,18 +148,18 @@ class TestInitCommand:
         working_directory: Path,
         cli_runner: CliRunner,
         mock_uuid,
-        temp_dir: Path,
+        tmp_path: Path,
     ):
         """Test that init handles invalid remote config gracefully."""
         # Setup mock home directory with invalid config
-        config_dir = temp_dir / ".config" / "dss"
+        config_dir = tmp_path / ".config" / "dss"
         config_dir.mkdir(parents=True)
         remote_config_path = config_dir / "remote"
 
         # Write invalid YAML
         remote_config_path.write_text("invalid: yaml: content: [")
 
-        mock_home.return_value = temp_dir
+        mock_home.return_value = tmp_path
 
         result = cli_runner.invoke(main, ["init"])
 
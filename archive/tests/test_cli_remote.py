@@ -1,11 +1,93 @@
 """Tests for remote operations (push/pull commands)."""
 
+import re
 from pathlib import Path
-from unittest.mock import MagicMock
 
-import yaml
+import pytest
 from click.testing import CliRunner
-from dss.cli import main
+from dss.cli import main, pull, push
+from tests.conftest import R
+
+
+# One findall pass collects every pushed filename for set assertions
+SUCCESS_PUSH = re.compile(r"Successfully pushed: (\S+)")
+
+# Pre-serialized manifests for tests whose input is a static document;
+# writing these bytes skips the YAML emitter entirely
+MANIFEST_PUSH_ALL = b"""\
+datasets:
+  another_file.txt:
+    sha256: def456
+    size_bytes: 8
+  test_file.txt:
+    sha256: abc123
+    size_bytes: 8
+manifest_uuid: test-uuid-1234
+remote@1:
+  base_path: /data/test
+  port: 22
+  uname: testuser
+  url: test.example.com
+version: '1.0'
+"""
+
+MANIFEST_PULL_ALL = b"""\
+datasets:
+  file1.txt:
+    sha256: abc123
+    size_bytes: 8
+  file2.txt:
+    sha256: def456
+    size_bytes: 8
+manifest_uuid: test-uuid-1234
+remote@1:
+  base_path: /data/test
+  uname: testuser
+  url: test.example.com
+version: '1.0'
+"""
+
+MANIFEST_REMOTE_2 = b"""\
+datasets:
+  test_file.txt:
+    sha256: abc123
+manifest_uuid: test-uuid-1234
+remote@2:
+  base_path: /data/remote2
+  uname: user2
+  url: remote2.example.com
+version: '1.0'
+"""
+
+
+# Canned subprocess outcomes shared by the parametrized scenario test:
+# (cli args, queued results, fallback returncode, expected output)
+SUBPROCESS_SCENARIOS = {
+    "mkdir_fail": (
+        ["push", "test_file.txt"],
+        [R(returncode=1, stderr="Permission denied"), R()],
+        0,
+        "Failed to create remote directory",
+    ),
+    "rsync_fail": (
+        ["push", "test_file.txt"],
+        [R(), R(returncode=1, stderr="Connection failed")],
+        0,
+        "Failed to push test_file.txt",
+    ),
+    "pull_ok": (
+        ["pull", "test_file.txt"],
+        [R(), R()],
+        0,
+        "Pulling test_file.txt from test.example.com",
+    ),
+    "pull_miss": (
+        ["pull", "test_file.txt"],
+        None,
+        1,
+        "Remote file not found",
+    ),
+}
 
 
 class TestPushCommand:
@@ -15,17 +97,13 @@ class TestPushCommand:
         self,
         working_directory: Path,
         cli_runner: CliRunner,
-        manifest_file: Path,
+        manifest_yaml_bytes: bytes,
         test_file: Path,
         mock_subprocess,
     ):
         """Test successful file push."""
         # Copy manifest to working directory
-        with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        Path("manifest.yml").write_bytes(manifest_yaml_bytes)
 
         result = cli_runner.invoke(main, ["push", "test_file.txt"])
 
@@ -63,75 +141,42 @@ class TestPushCommand:
         test_file1.write_text("content1")
         test_file2.write_text("content2")
 
-        manifest_data = {
-            "version": "1.0",
-            "manifest_uuid": "test-uuid-1234",
-            "datasets": {
-                "test_file.txt": {"sha256": "abc123", "size_bytes": 8},
-                "another_file.txt": {"sha256": "def456", "size_bytes": 8},
-            },
-            "remote@1": {
-                "uname": "testuser",
-                "url": "test.example.com",
-                "base_path": "/data/test",
-                "port": 22,
-            },
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        Path("manifest.yml").write_bytes(MANIFEST_PUSH_ALL)
 
         result = cli_runner.invoke(main, ["push"])
 
         assert result.exit_code == 0
-        assert "Successfully pushed: test_file.txt" in result.output
-        assert "Successfully pushed: another_file.txt" in result.output
+        assert set(SUCCESS_PUSH.findall(result.output)) >= {
+            "test_file.txt",
+            "another_file.txt",
+        }
 
     def test_push_missing_manifest(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, empty_working_directory: Path, cli_runner: CliRunner, monkeypatch
     ):
         """Test push fails without manifest."""
-        result = cli_runner.invoke(main, ["push"])
+        monkeypatch.chdir(empty_working_directory)
+        result = cli_runner.invoke(push, [])
 
         assert result.exit_code == 1
         assert "No manifest.yml found" in result.output
 
     def test_push_missing_remote_config(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, no_remote_manifest_directory: Path, cli_runner: CliRunner, monkeypatch
     ):
         """Test push fails without remote configuration."""
-        manifest_data = {
-            "version": "1.0",
-            "manifest_uuid": "test-uuid-1234",
-            "datasets": {"test_file.txt": {"sha256": "abc123"}},
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
-
-        result = cli_runner.invoke(main, ["push"])
+        monkeypatch.chdir(no_remote_manifest_directory)
+        result = cli_runner.invoke(push, [])
 
         assert result.exit_code == 1
         assert "No remote@1 configuration found" in result.output
 
     def test_push_missing_manifest_uuid(
-        self, working_directory: Path, cli_runner: CliRunner, test_file: Path
+        self, no_uuid_manifest_directory: Path, cli_runner: CliRunner, monkeypatch
     ):
         """Test push fails without manifest UUID."""
-        manifest_data = {
-            "version": "1.0",
-            "datasets": {"test_file.txt": {"sha256": "abc123"}},
-            "remote@1": {
-                "uname": "testuser",
-                "url": "test.example.com",
-                "base_path": "/data/test",
-            },
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
-
-        result = cli_runner.invoke(main, ["push"])
+        monkeypatch.chdir(no_uuid_manifest_directory)
+        result = cli_runner.invoke(push, [])
 
         assert result.exit_code == 1
         assert "No manifest UUID found" in result.output
@@ -140,144 +185,54 @@ class TestPushCommand:
         self,
         working_directory: Path,
         cli_runner: CliRunner,
-        manifest_file: Path,
+        manifest_yaml_bytes: bytes,
         mock_subprocess,
     ):
         """Test push skips nonexistent local files."""
-        with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        Path("manifest.yml").write_bytes(manifest_yaml_bytes)
 
         result = cli_runner.invoke(main, ["push", "test_file.txt"])
 
         assert result.exit_code == 0
         assert "Local file not found: test_file.txt" in result.output
 
-    def test_push_mkdir_failure(
-        self,
-        working_directory: Path,
-        cli_runner: CliRunner,
-        manifest_file: Path,
-        test_file: Path,
-        mock_subprocess,
-    ):
-        """Test push handles mkdir failure."""
-        # Setup mock to fail on mkdir
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=1, stderr="Permission denied"),  # mkdir fails
-            MagicMock(returncode=0),  # rsync would succeed but won't be called
-        ]
-
-        with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
+class TestSubprocessScenarios:
+    """Push/pull behavior across canned subprocess outcomes."""
 
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
-
-        result = cli_runner.invoke(main, ["push", "test_file.txt"])
-
-        assert result.exit_code == 0
-        assert "Failed to create remote directory" in result.output
-
-    def test_push_rsync_failure(
+    @pytest.mark.parametrize("scenario", sorted(SUBPROCESS_SCENARIOS))
+    def test_subprocess_scenario(
         self,
+        scenario: str,
         working_directory: Path,
         cli_runner: CliRunner,
-        manifest_file: Path,
-        test_file: Path,
+        manifest_yaml_bytes: bytes,
         mock_subprocess,
     ):
-        """Test push handles rsync failure."""
-        # Setup mock to succeed on mkdir but fail on rsync
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),  # mkdir succeeds
-            MagicMock(returncode=1, stderr="Connection failed"),  # rsync fails
-        ]
+        """Run one wired scenario and check the reported outcome."""
+        args, queued, fallback, expected = SUBPROCESS_SCENARIOS[scenario]
 
-        with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
+        Path("manifest.yml").write_bytes(manifest_yaml_bytes)
+        if args[0] == "push":
+            # Push scenarios need the local file to exist
+            Path("test_file.txt").write_text("Hello, World!")
 
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        mock_subprocess.side_effect = queued
+        mock_subprocess.return_value.returncode = fallback
 
-        result = cli_runner.invoke(main, ["push", "test_file.txt"])
+        result = cli_runner.invoke(main, args)
 
         assert result.exit_code == 0
-        assert "Failed to push test_file.txt" in result.output
+        assert expected in result.output
 
 
 class TestPullCommand:
     """Tests for the pull CLI command."""
 
-    def test_pull_success(
-        self,
-        working_directory: Path,
-        cli_runner: CliRunner,
-        manifest_file: Path,
-        mock_subprocess,
-    ):
-        """Test successful file pull."""
-        with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
-
-        # Mock successful pull - file exists and download succeeds
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),  # ls check succeeds
-            MagicMock(returncode=0),  # rsync succeeds
-        ]
-
-        result = cli_runner.invoke(main, ["pull", "test_file.txt"])
-
-        assert result.exit_code == 0
-        assert "Pulling test_file.txt from test.example.com" in result.output
-
-    def test_pull_missing_remote_file(
-        self,
-        working_directory: Path,
-        cli_runner: CliRunner,
-        manifest_file: Path,
-        mock_subprocess,
-    ):
-        """Test pull handles missing remote file."""
-        with open(manifest_file) as f:
-            manifest_data = yaml.safe_load(f)
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
-
-        # Mock file not found on remote
-        mock_subprocess.return_value.returncode = 1
-
-        result = cli_runner.invoke(main, ["pull", "test_file.txt"])
-
-        assert result.exit_code == 0
-        assert "Remote file not found" in result.output
-
     def test_pull_all_files(
         self, working_directory: Path, cli_runner: CliRunner, mock_subprocess
     ):
         """Test pulling all files from manifest."""
-        manifest_data = {
-            "version": "1.0",
-            "manifest_uuid": "test-uuid-1234",
-            "datasets": {
-                "file1.txt": {"sha256": "abc123", "size_bytes": 8},
-                "file2.txt": {"sha256": "def456", "size_bytes": 8},
-            },
-            "remote@1": {
-                "uname": "testuser",
-                "url": "test.example.com",
-                "base_path": "/data/test",
-            },
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        Path("manifest.yml").write_bytes(MANIFEST_PULL_ALL)
 
         # Mock all operations succeed
         mock_subprocess.return_value.returncode = 0
@@ -292,19 +247,7 @@ class TestPullCommand:
         self, working_directory: Path, cli_runner: CliRunner, mock_subprocess
     ):
         """Test pull with custom remote server."""
-        manifest_data = {
-            "version": "1.0",
-            "manifest_uuid": "test-uuid-1234",
-            "datasets": {"test_file.txt": {"sha256": "abc123"}},
-            "remote@2": {
-                "uname": "user2",
-                "url": "remote2.example.com",
-                "base_path": "/data/remote2",
-            },
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        Path("manifest.yml").write_bytes(MANIFEST_REMOTE_2)
 
         mock_subprocess.return_value.returncode = 0
 
@@ -316,23 +259,11 @@ class TestPullCommand:
         assert "user2@remote2.example.com" in " ".join(rsync_call[0][0])
 
     def test_pull_missing_manifest_uuid(
-        self, working_directory: Path, cli_runner: CliRunner
+        self, no_uuid_manifest_directory: Path, cli_runner: CliRunner, monkeypatch
     ):
         """Test pull fails without manifest UUID."""
-        manifest_data = {
-            "version": "1.0",
-            "datasets": {"test_file.txt": {"sha256": "abc123"}},
-            "remote@1": {
-                "uname": "testuser",
-                "url": "test.example.com",
-                "base_path": "/data/test",
-            },
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
-
-        result = cli_runner.invoke(main, ["pull"])
+        monkeypatch.chdir(no_uuid_manifest_directory)
+        result = cli_runner.invoke(pull, [])
 
         assert result.exit_code == 1
         assert "No manifest UUID found" in result.output
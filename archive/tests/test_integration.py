@@ -1,12 +1,48 @@
 """Integration tests for dss CLI workflow."""
 
 import hashlib
+import re
 from pathlib import Path
-from unittest.mock import patch
 
 import yaml
 from click.testing import CliRunner
 from dss.cli import main
+from tests.conftest import SafeDumper, SafeLoader
+
+
+# Expected digests computed once at import rather than inside test bodies
+FILE1_HASH = hashlib.sha256(b"Modified content for file 1").hexdigest()
+FILE2_HASH = hashlib.sha256(b"Content for file 2").hexdigest()
+
+# Pre-serialized old-style manifest (no manifest UUID, per-file uuid key);
+# static input, so skip the YAML emitter and write the bytes directly
+OLD_MANIFEST_YAML = b"""\
+datasets:
+  legacy_file.txt:
+    sha256: abc123def456
+    size_bytes: 100
+    size_human: 100B
+    uploaded: '2023-01-01T00:00:00Z'
+    uuid: old-file-uuid-5678
+version: '1.0'
+"""
+
+
+def _write_manifest(data: dict) -> None:
+    """Serialize data to manifest.yml in a single write call."""
+    Path("manifest.yml").write_bytes(yaml.dump(data, Dumper=SafeDumper).encode())
+
+
+def _load_manifest() -> dict:
+    """Parse manifest.yml from a single bytes read."""
+    return yaml.load(Path("manifest.yml").read_bytes(), Loader=SafeLoader)
+
+
+def assert_all_in(out: str, *needles: str) -> None:
+    """Assert every needle appears in out with one compiled regex pass."""
+    pattern = "".join(f"(?=.*{re.escape(needle)})" for needle in needles)
+    missing = re.search(pattern, out, re.DOTALL) is None
+    assert not missing, [needle for needle in needles if needle not in out]
 
 
 class TestFullWorkflow:
@@ -49,8 +85,7 @@ class TestFullWorkflow:
         assert "File data1.txt has changed, updating information" in result.output
 
         # Verify final manifest state
-        with open("manifest.yml") as f:
-            manifest_data = yaml.safe_load(f)
+        manifest_data = _load_manifest()
 
         assert manifest_data["manifest_uuid"] == "test-uuid-1234"
         assert len(manifest_data["datasets"]) == 2
@@ -58,29 +93,19 @@ class TestFullWorkflow:
         assert "data2.txt" in manifest_data["datasets"]
 
         # Verify SHA256 hashes are correct
-        file1_hash = hashlib.sha256(b"Modified content for file 1").hexdigest()
-        file2_hash = hashlib.sha256(b"Content for file 2").hexdigest()
-
-        assert manifest_data["datasets"]["data1.txt"]["sha256"] == file1_hash
-        assert manifest_data["datasets"]["data2.txt"]["sha256"] == file2_hash
+        assert manifest_data["datasets"]["data1.txt"]["sha256"] == FILE1_HASH
+        assert manifest_data["datasets"]["data2.txt"]["sha256"] == FILE2_HASH
 
-    @patch("dss.cli.subprocess.run")
     def test_complete_remote_workflow(
-        self, mock_subprocess, working_directory: Path, cli_runner: CliRunner, mock_uuid
+        self, working_directory: Path, cli_runner: CliRunner, mock_uuid, mock_subprocess
     ):
         """Test complete remote workflow: init -> add -> push -> pull."""
-        # Mock all subprocess calls to succeed
-        mock_subprocess.return_value.returncode = 0
-        mock_subprocess.return_value.stdout = ""
-        mock_subprocess.return_value.stderr = ""
-
         # Initialize manifest with remote config
         result = cli_runner.invoke(main, ["init"])
         assert result.exit_code == 0
 
         # Add remote configuration to manifest
-        with open("manifest.yml") as f:
-            manifest_data = yaml.safe_load(f)
+        manifest_data = _load_manifest()
 
         manifest_data["remote@1"] = {
             "uname": "testuser",
@@ -89,8 +114,7 @@ class TestFullWorkflow:
             "port": 22,
         }
 
-        with open("manifest.yml", "w") as f:
-            yaml.dump(manifest_data, f)
+        _write_manifest(manifest_data)
 
         # Create and add files
         file1 = Path("dataset1.txt")
@@ -105,12 +129,14 @@ class TestFullWorkflow:
         # Push files to remote
         result = cli_runner.invoke(main, ["push"])
         assert result.exit_code == 0
-        assert "Successfully pushed: dataset1.txt" in result.output
-        assert "Successfully pushed: dataset2.txt" in result.output
+        assert_all_in(
+            result.output,
+            "Successfully pushed: dataset1.txt",
+            "Successfully pushed: dataset2.txt",
+        )
 
         # Verify push created correct remote paths
-        with open("manifest.yml") as f:
-            manifest_data = yaml.safe_load(f)
+        manifest_data = _load_manifest()
 
         assert (
             manifest_data["datasets"]["dataset1.txt"]["remote@1"]
@@ -128,24 +154,16 @@ class TestFullWorkflow:
         result = cli_runner.invoke(main, ["pull"])
         assert result.exit_code == 0
 
-        # Verify subprocess calls included correct paths with manifest UUID
-        ssh_calls = [
-            call for call in mock_subprocess.call_args_list if "ssh" in str(call)
-        ]
-        rsync_calls = [
-            call for call in mock_subprocess.call_args_list if "rsync" in str(call)
-        ]
-
         # Should have SSH calls for file existence checks
-        assert len(ssh_calls) >= 2
+        assert mock_subprocess.ssh_count >= 2
 
         # Should have rsync calls for both push and pull operations
-        assert len(rsync_calls) >= 4  # 2 push + 2 pull
+        assert mock_subprocess.rsync_count >= 4  # 2 push + 2 pull
 
         # Verify all remote paths use manifest UUID
-        for call in rsync_calls:
+        for call in mock_subprocess.call_args_list:
             call_str = " ".join(call[0][0])
-            if "test.example.com" in call_str:
+            if "rsync" in call_str and "test.example.com" in call_str:
                 assert "test-uuid-1234" in call_str
 
     def test_backward_compatibility_workflow(
@@ -153,21 +171,7 @@ class TestFullWorkflow:
     ):
         """Test backward compatibility with old manifests without UUID."""
         # Create old-style manifest manually
-        old_manifest = {
-            "version": "1.0",
-            "datasets": {
-                "legacy_file.txt": {
-                    "uuid": "old-file-uuid-5678",  # Old per-file UUID
-                    "sha256": "abc123def456",
-                    "size_bytes": 100,
-                    "size_human": "100B",
-                    "uploaded": "2023-01-01T00:00:00Z",
-                }
-            },
-        }
-
-        with open("manifest.yml", "w") as f:
-            yaml.dump(old_manifest, f)
+        Path("manifest.yml").write_bytes(OLD_MANIFEST_YAML)
 
         # Create the legacy file
         legacy_file = Path("legacy_file.txt")
@@ -179,8 +183,7 @@ class TestFullWorkflow:
         assert "Generated new manifest UUID: test-uuid-1234" in result.output
 
         # Verify manifest was upgraded
-        with open("manifest.yml") as f:
-            updated_manifest = yaml.safe_load(f)
+        updated_manifest = _load_manifest()
 
         assert updated_manifest["manifest_uuid"] == "test-uuid-1234"
         assert "legacy_file.txt" in updated_manifest["datasets"]
@@ -257,8 +260,7 @@ class TestFullWorkflow:
         assert "Summary: 2 added, 0 updated, 0 unchanged" in result.output
 
         # Verify only valid files were added
-        with open("manifest.yml") as f:
-            manifest_data = yaml.safe_load(f)
+        manifest_data = _load_manifest()
 
         assert len(manifest_data["datasets"]) == 2
         assert "valid1.txt" in manifest_data["datasets"]
@@ -3,7 +3,6 @@
 import hashlib
 import logging
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 from colorama import Fore, Style
@@ -80,9 +79,9 @@ class TestCalculateSha256:
         expected_hash = hashlib.sha256(b"Hello, World!").hexdigest()
         assert result == expected_hash
 
-    def test_calculate_sha256_nonexistent_file(self, temp_dir: Path):
+    def test_calculate_sha256_nonexistent_file(self, tmp_path: Path):
         """Test SHA256 calculation of nonexistent file raises error."""
-        nonexistent_file = temp_dir / "nonexistent.txt"
+        nonexistent_file = tmp_path / "nonexistent.txt"
 
         with pytest.raises(FileNotFoundError):
             calculate_sha256(nonexistent_file)
@@ -125,21 +124,29 @@ class TestFormatSize:
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
-    @patch("dss.cli.logging.basicConfig")
-    def test_setup_logging_default(self, mock_basic_config):
+    @pytest.fixture(autouse=True)
+    def clean_root_logger(self):
+        """Give each test an unconfigured root logger and restore it after.
+
+        basicConfig is a no-op once handlers exist, so clearing them lets
+        setup_logging be called for real instead of through a mock.
+        """
+        root = logging.getLogger()
+        saved_handlers = root.handlers[:]
+        saved_level = root.level
+        root.handlers.clear()
+        yield root
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    def test_setup_logging_default(self, clean_root_logger):
         """Test default logging setup."""
         setup_logging()
 
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args
-        assert call_args[1]["level"] == logging.INFO
-        assert call_args[1]["format"] == "%(message)s"
+        assert clean_root_logger.level == logging.INFO
 
-    @patch("dss.cli.logging.basicConfig")
-    def test_setup_logging_verbose(self, mock_basic_config):
+    def test_setup_logging_verbose(self, clean_root_logger):
         """Test verbose logging setup."""
         setup_logging(verbose=True)
 
-        mock_basic_config.assert_called_once()
-        call_args = mock_basic_config.call_args
-        assert call_args[1]["level"] == logging.DEBUG
+        assert clean_root_logger.level == logging.DEBUG
@@ -1,3 +1,6 @@
+import hashlib
+import os
+import zipfile
 import parselmouth
 import numpy as np
 import json
@@ -5,9 +8,66 @@ import json
 import parselmouth
 import matplotlib.pyplot as plt
 import numpy as np
+from pathlib import Path
 from typing import Tuple, List, Optional
 
 
+try:
+    # Optional: fuses the confidence mask into one compiled pass with
+    # no intermediate boolean arrays
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+_FORMANT_CACHE_ROOT = Path.home() / ".cache" / "pyrecord" / "formants"
+
+
+def _confident_mask(f1, f2, f0, intensity_db,
+                    intensity_threshold, voicing_threshold):
+    """Elementwise confidence criteria over the sampled tracks.
+
+    NaN samples fail every comparison and drop out automatically, in
+    both the NumPy and the compiled variant.
+    """
+    return (
+        (f1 > 200)
+        & (f2 > 500)
+        & (f1 < f2)
+        & (intensity_db >= intensity_threshold)
+        & (f0 > 0)
+        & (f0 >= voicing_threshold)
+    )
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _confident_mask(f1, f2, f0, intensity_db,  # noqa: F811
+                        intensity_threshold, voicing_threshold):
+        n = f1.shape[0]
+        out = np.empty(n, np.bool_)
+        for i in range(n):
+            out[i] = (
+                f1[i] > 200.0
+                and f2[i] > 500.0
+                and f1[i] < f2[i]
+                and intensity_db[i] >= intensity_threshold
+                and f0[i] > 0.0
+                and f0[i] >= voicing_threshold
+            )
+        return out
+
+
+def _formant_cache_path(wave_file_path: str, params: dict) -> Path:
+    """Cache location keyed by the audio bytes and analysis parameters."""
+    digest = hashlib.sha256()
+    with open(wave_file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(repr(sorted(params.items())).encode())
+    return _FORMANT_CACHE_ROOT / f"{digest.hexdigest()}.npz"
+
+
 def extract_f1_f2_confident(wave_file_path: str, 
                            time_step: Optional[float] = None,
                            max_formant: float = 5500.0,
@@ -45,12 +105,38 @@ def extract_f1_f2_confident(wave_file_path: str,
         (times, f1_values, f2_values) - all filtered for confident measurements
     """
     
+    # Formant extraction on a long clip takes seconds; a cached result
+    # keyed by audio content and parameters loads in milliseconds
+    cache_path = _formant_cache_path(
+        wave_file_path,
+        {
+            'time_step': time_step,
+            'max_formant': max_formant,
+            'num_formants': num_formants,
+            'window_length': window_length,
+            'pre_emphasis': pre_emphasis,
+            'intensity_threshold': intensity_threshold,
+            'voicing_threshold': voicing_threshold,
+        },
+    )
+    try:
+        cached = np.load(cache_path)
+        return (
+            cached['times'].tolist(),
+            cached['f1'].tolist(),
+            cached['f2'].tolist(),
+        )
+    except (OSError, ValueError, zipfile.BadZipFile):
+        # Missing cache, or a truncated/corrupt archive left by an
+        # interrupted write: recompute and overwrite it
+        pass
+
     # Load the sound file
     try:
         sound = parselmouth.Sound(wave_file_path)
     except Exception as e:
         raise ValueError(f"Could not load audio file: {e}")
-    
+
     # Extract formants
     formant_kwargs = {
         'max_number_of_formants': num_formants,
@@ -72,57 +158,44 @@ def extract_f1_f2_confident(wave_file_path: str,
     intensity = sound.to_intensity()
     
     # Get time points from formant object
-    times = formants.xs()
-    
-    confident_times = []
-    confident_f1 = []
-    confident_f2 = []
-    
-    for i, time in enumerate(times):
-        try:
-            # Get formant values at this time point
-            f1 = formants.get_value_at_time(formant_number=1, time=time)
-            f2 = formants.get_value_at_time(formant_number=2, time=time)
-
-            # Get pitch (fundamental frequency) at this time
-            f0 = pitch.get_value_at_time(time)
-
-            # Get intensity at this time
-            intensity_db = intensity.get_value(time)
-
-            # Check if this point should be considered "confident"
-            # Similar to Praat's criteria for plotting formants
-            
-            # 1. Must have valid formant values (not NaN or undefined)
-            if np.isnan(f1) or np.isnan(f2) or f1 <= 0 or f2 <= 0:
-                continue
-                
-            # 2. Must have sufficient intensity
-            if np.isnan(intensity_db) or intensity_db < intensity_threshold:
-                continue
-                
-            # 3. Must have voicing (valid F0)
-            if np.isnan(f0) or f0 <= 0:
-                continue
-                
-            # 4. Formants should be in reasonable ranges and order
-            if f1 >= f2 or f1 < 200 or f2 < 500:
-                continue
-                
-            # 5. Additional voicing strength check using pitch strength
-            pitch_strength = pitch.get_value_at_time(time)
-            if np.isnan(pitch_strength) or pitch_strength < voicing_threshold:
-                continue
-            
-            # If all checks pass, this is a confident measurement
-            confident_times.append(time)
-            confident_f1.append(f1)
-            confident_f2.append(f2)
-            
-        except Exception as e:
-            continue
-    
-    return confident_times, confident_f1, confident_f2
+    times = np.asarray(formants.xs())
+
+    # Querying at the frame centers themselves keeps get_value_at_time
+    # from interpolating between frames
+    f1 = np.array([formants.get_value_at_time(1, t) for t in times])
+    f2 = np.array([formants.get_value_at_time(2, t) for t in times])
+
+    # Pitch and intensity expose their whole tracks as contiguous
+    # arrays; resample each onto the formant frame times with one
+    # interp call instead of a Python->C round-trip per sample
+    f0 = np.interp(times, pitch.xs(), pitch.selected_array["frequency"])
+    intensity_db = np.interp(times, intensity.xs(), intensity.values[0])
+
+    # A point is "confident" (similar to Praat's criteria for plotting
+    # formants) when the formants are valid, ordered, and in range, the
+    # frame is voiced, and the intensity clears the threshold
+    mask = _confident_mask(
+        f1, f2, f0, intensity_db, intensity_threshold, voicing_threshold
+    )
+
+    confident_times = times[mask]
+    confident_f1 = f1[mask]
+    confident_f2 = f2[mask]
+
+    # Write via a temp file and rename so an interrupt can never leave
+    # a truncated archive at the final path
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".npz.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f, times=confident_times, f1=confident_f1, f2=confident_f2
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+    return confident_times.tolist(), confident_f1.tolist(), confident_f2.tolist()
 
 
 def extract_f1_f2_confident_with_details(wave_file_path: str, **kwargs) -> dict:
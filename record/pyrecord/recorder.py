@@ -1,4 +1,5 @@
-import select
+import queue
+import selectors
 import subprocess
 import sys
 from datetime import datetime
@@ -52,18 +53,28 @@ class AudioRecorder:
             self.json_file = "output.json"
 
 
-    def record_audio(self, sample_rate=44100, channels=1, dtype=np.int16):
+    def record_audio(self, sample_rate=44100, channels=1, dtype=np.int16,
+                     blocksize=256, latency="low"):
         """
         Record audio until any key is pressed.
 
+        blocksize and latency are forwarded to the input stream; the
+        small default block with low latency keeps capture delay well
+        under the device default.
+
+        Blocks are streamed to the WAV file as they arrive: the audio
+        callback hands each block to a queue and a writer thread appends
+        it to an already-open wave file, so memory stays bounded by the
+        block size no matter how long the recording runs.
+
         Returns:
             bool: True if audio was recorded, False otherwise
         """
         clear_terminal()
         print(f"{Style.DIM}Press any key to stop recording...")
 
-        # Storage for recorded audio
-        recorded_audio = []
+        blocks = queue.SimpleQueue()
+        frames_written = 0
         recording = True
 
         def audio_callback(indata, frames, time, status):
@@ -71,50 +82,61 @@ class AudioRecorder:
             if status:
                 print(f"{Style.DIM}Audio status: {status}")
             if recording:
-                recorded_audio.append(indata.copy())
-
-        def wait_for_keypress():
-            """Wait for any key press (cross-platform)"""
-            nonlocal recording
+                # Never block in the callback; hand the copy off to the
+                # writer thread
+                blocks.put(indata.copy())
+
+        def drain_blocks(wf):
+            """Append queued blocks to the WAV file until the sentinel"""
+            nonlocal frames_written
+            while True:
+                block = blocks.get()
+                if block is None:
+                    return
+                wf.writeframes(block.tobytes())
+                frames_written += len(block)
+
+        # Watch stdin from the main thread instead of parking a helper
+        # thread on a blocking select
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ)
+        old_settings = termios.tcgetattr(sys.stdin)
+
+        # Open the WAV file up front (overwriting any previous take) and
+        # record straight into it
+        with wave.open(self.wav_file, "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(np.dtype(dtype).itemsize)
+            wf.setframerate(sample_rate)
 
-            # Unix/Linux/Mac
-            old_settings = termios.tcgetattr(sys.stdin)
+            writer = threading.Thread(target=drain_blocks, args=(wf,))
+            writer.start()
             try:
                 tty.setraw(sys.stdin.fileno())
-                select.select([sys.stdin], [], [])
+                with sd.InputStream(
+                    samplerate=sample_rate,
+                    channels=channels,
+                    dtype=dtype,
+                    blocksize=blocksize,
+                    latency=latency,
+                    callback=audio_callback,
+                ):
+                    # Short timeout keeps Ctrl-C responsive while the
+                    # callback keeps feeding the writer
+                    while not sel.select(timeout=0.05):
+                        pass
             finally:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                sel.close()
+                recording = False
+                blocks.put(None)  # Sentinel: flush and stop the writer
+                writer.join()
 
-            recording = False
-
-        # Start key detection in separate thread
-        key_thread = threading.Thread(target=wait_for_keypress, daemon=True)
-        key_thread.start()
-
-        # Start recording
-        with sd.InputStream(
-            samplerate=sample_rate,
-            channels=channels,
-            dtype=dtype,
-            callback=audio_callback,
-        ):
-            key_thread.join()  # Wait for key press
-
-        # Convert recorded audio to numpy array
-        if not recorded_audio:
-            print("{Style.DIM}No audio data recorded.")
+        if frames_written == 0:
+            print(f"{Style.DIM}No audio data recorded.")
             return False
 
-        audio_data = np.concatenate(recorded_audio, axis=0)
-
-        # Save as WAV file (overwrite existing)
-        with wave.open(self.wav_file, "wb") as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(np.dtype(dtype).itemsize)
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_data.tobytes())
-
-        duration = len(audio_data) / sample_rate
+        duration = frames_written / sample_rate
         print(f"{Style.DIM}Duration: {duration:.2f} seconds")
 
         return True
@@ -1,51 +1,114 @@
 import json
 import math
 import subprocess
+import sys
 
 from colorama import Fore, Style, init
 
+try:
+    # Optional: transcribe in process with a model loaded once per
+    # session instead of shelling out (and re-loading) per recording
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
 
 init(autoreset=True)
 
 
+def _load_model():
+    """Load Whisper on the best device available.
+
+    CUDA with float16 is several times faster than CPU when a GPU is
+    present; otherwise fall back to int8 on whatever CTranslate2 picks
+    (its backend has no Metal support, so Apple machines land on the
+    quantized CPU path).
+    """
+    try:
+        return WhisperModel("small", device="cuda", compute_type="float16")
+    except (RuntimeError, ValueError):
+        return WhisperModel("small", device="auto", compute_type="int8")
+
+
+# Bound once; skips re-parsing the format spec on every call in the
+# per-word table loop
+_FMT_TIME = "{:02d}:{:04.1f}".format
+
+
 def format_time(seconds):
-    minutes = int(seconds // 60)
-    secs = seconds % 60
-    return f"{minutes:02d}:{secs:04.1f}"
+    minutes, secs = divmod(seconds, 60)
+    return _FMT_TIME(int(minutes), secs)
 
 
 class AudioTranscriber:
     def __init__(self):
-        pass
+        # Pay the model load once here; every later transcribe() call
+        # is then pure inference. Falls back to the external transcribe
+        # command when faster-whisper is not installed.
+        self.model = _load_model() if WhisperModel is not None else None
 
     def transcribe(self, wave_file_path, json_file_path):
-        subprocess.run([
-            "transcribe",
-            "--language",
-            "fr-FR",
-            "--detailed",
-            "--confidence",
-            "--alternatives",
-            "--json",
-            json_file_path,
-            wave_file_path
-        ], stdout=subprocess.DEVNULL)
+        if self.model is None:
+            subprocess.run([
+                "transcribe",
+                "--language",
+                "fr-FR",
+                "--detailed",
+                "--confidence",
+                "--alternatives",
+                "--json",
+                json_file_path,
+                wave_file_path
+            ], stdout=subprocess.DEVNULL)
+            return
+
+        segments, _ = self.model.transcribe(
+            wave_file_path, language="fr", word_timestamps=True
+        )
+
+        # Write the same JSON shape the external command produces:
+        # word-level segments plus the full transcript
+        out_segments = []
+        parts = []
+        for segment in segments:
+            for word in segment.words:
+                out_segments.append({
+                    "text": word.word.strip(),
+                    "confidence": word.probability,
+                    "startTime": word.start,
+                    "endTime": word.end,
+                })
+            parts.append(segment.text.strip())
+
+        with open(json_file_path, 'w') as file:
+            json.dump(
+                {"transcript": " ".join(parts), "segments": out_segments},
+                file, ensure_ascii=False
+            )
 
     def message(self, json_file_path):
         with open(json_file_path, 'r') as file:
             data = json.load(file)
 
-        # Column headers
-        print(f"{Fore.CYAN}{Style.NORMAL}{'Word':<20}{Fore.YELLOW}{'Confidence':<12}{Fore.MAGENTA}{'  Start Time':<14}{'  End Time':<12}{Style.RESET_ALL}")
-        print("-" * 60)
+        # Build the whole table in memory and emit it with one write;
+        # per-line print calls each flush the (unbuffered-looking) tty
+        lines = [
+            f"{Fore.CYAN}{Style.NORMAL}{'Word':<20}{Fore.YELLOW}{'Confidence':<12}{Fore.MAGENTA}{'  Start Time':<14}{'  End Time':<12}{Style.RESET_ALL}",
+            "-" * 60,
+        ]
 
-        # Iterate through segments and print each line
         for seg in data['segments']:
             word = f"{Fore.CYAN}{seg['text']:<20}"
             conf = f"{Fore.YELLOW}{seg['confidence']:.3f}{'':<5}"
             start = f"{Fore.MAGENTA}  {format_time(seg['startTime']):<12}"
             end = f"  {format_time(seg['endTime']):<12}"
-            print(f"{word}{conf}  {start}{end}")
+            lines.append(f"{word}{conf}  {start}{end}")
+
+        # Full transcript at the end
+        lines.append(
+            "\n" + Fore.GREEN + "Full Transcript: " + Style.RESET_ALL
+            + data['transcript']
+        )
 
-        # Print the full transcript at the end
-        print("\n" + Fore.GREEN + "Full Transcript: " + Style.RESET_ALL + data['transcript'])
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
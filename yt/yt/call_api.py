@@ -1,46 +1,91 @@
-import json
-import tempfile
+import io
+import subprocess
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import openai
-from pydub import AudioSegment
+
+# Whisper's native input format; decoding straight to it keeps the
+# chunk math trivial and the uploads small
+_SAMPLE_RATE = 16000
+_SAMPLE_WIDTH = 2
+_CHUNK_LENGTH_SEC = 600
+_CHUNK_BYTES = _CHUNK_LENGTH_SEC * _SAMPLE_RATE * _SAMPLE_WIDTH
 
 
 def transcribe_long_audio(
     mp3_path: Path, language: str = "fr", model: str = "whisper-1"
 ) -> dict:
-    # Load the audio
-    audio = AudioSegment.from_file(mp3_path)
-
-    # Constants
-    max_chunk_length_ms = 600 * 1000
-    chunks = [audio[i:i + max_chunk_length_ms] for i in range(0, len(audio), max_chunk_length_ms)]
+    # Stream 16 kHz mono PCM out of ffmpeg (the same decoder pydub
+    # shells out to) and hand each chunk to the upload pool as soon as
+    # its bytes arrive, so the first uploads overlap the rest of the
+    # decode instead of waiting for the whole file
+    proc = subprocess.Popen(
+        [
+            "ffmpeg", "-v", "error", "-i", str(mp3_path),
+            "-f", "s16le", "-ar", str(_SAMPLE_RATE), "-ac", "1", "-",
+        ],
+        stdout=subprocess.PIPE,
+    )
 
     # OpenAI client
     client = openai.OpenAI()
 
-    segment_list = []
+    def process(idx: int, pcm: bytes) -> list:
+        """Upload one chunk and return its offset-stamped segments."""
+        # Serialize the chunk in memory; no temp file round-trip
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(_SAMPLE_WIDTH)
+            wf.setframerate(_SAMPLE_RATE)
+            wf.writeframes(pcm)
 
-    for idx, chunk in enumerate(chunks):
-        start_time_ms = idx * max_chunk_length_ms
-        start_time_sec = start_time_ms / 1000
+        result = client.audio.transcriptions.create(
+            file=("chunk.wav", buf.getvalue(), "audio/wav"),
+            model=model,
+            language=language,
+            response_format="verbose_json"
+        )
 
-        # Save chunk to temp file
-        with tempfile.NamedTemporaryFile(suffix=".mp3") as tmpfile:
-            chunk.export(tmpfile.name, format="mp3")
+        # Offset timestamps from the chunk index, so results are
+        # independent of completion order
+        start_time_sec = idx * _CHUNK_LENGTH_SEC
+        chunk_segments = []
+        for segment in result.segments:
+            # model_dump gives the dict directly; no serialize/parse
+            # round-trip through a JSON string
+            out = segment.model_dump()
+            out["offset"] = start_time_sec
+            chunk_segments.append(out)
+        return chunk_segments
 
-            with open(tmpfile.name, "rb") as audio_file:
-                result = client.audio.transcriptions.create(
-                    file=audio_file,
-                    model=model,
-                    language=language,
-                    response_format="verbose_json"
+    futures = []
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            idx = 0
+            while pcm := proc.stdout.read(_CHUNK_BYTES):
+                futures.append(pool.submit(process, idx, pcm))
+                idx += 1
+
+            # A failed decode (bad file, unsupported codec) just looks
+            # like early EOF here; check the exit status before trusting
+            # the results, or the caller would cache an empty transcript
+            proc.stdout.close()
+            if proc.wait() != 0:
+                raise RuntimeError(
+                    f"ffmpeg failed to decode {mp3_path} "
+                    f"(exit code {proc.returncode})"
                 )
 
-        # Offset timestamps and add segments
-        for segment in result.segments:
-            out = json.loads(segment.model_dump_json())
-            out["offset"] = start_time_sec
-            segment_list.append(out)
+            segment_list = []
+            for future in futures:
+                segment_list.extend(future.result())
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
 
     return segment_list
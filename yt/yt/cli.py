@@ -1,13 +1,21 @@
 """Command line interface for ptools."""
 
 import json
+import tempfile
 from pathlib import Path
 
 import click
 import colorama
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from openai import OpenAI
 
+try:
+    # Optional: parses and serializes the large transcript files
+    # several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import __version__
 from .call_api import transcribe_long_audio
 from .rfrance import get_radio_france
@@ -15,6 +23,23 @@ from .rfrance import get_radio_france
 colorama.init()
 client = OpenAI()
 
+# Template directory resolved relative to the package rather than a
+# hardcoded checkout path. The environment is built once: compiled
+# templates persist across runs via the bytecode cache, and with
+# auto_reload off the per-render mtime stat goes away too.
+_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "data"
+_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(tempfile.gettempdir()),
+)
+
+
+# Bound once; skips re-parsing the format spec for every segment
+_FMT_HMS = "{:02d}:{:02d}:{:02d}".format
+_FMT_MS = "{:02d}:{:02d}".format
+
 
 def format_duration(seconds):
     seconds = int(seconds)
@@ -23,23 +48,14 @@ def format_duration(seconds):
     minutes, secs = divmod(remainder, 60)
 
     if hours > 0:
-        return f"{hours:02}:{minutes:02}:{secs:02}"
+        return _FMT_HMS(hours, minutes, secs)
     else:
-        return f"{minutes:02}:{secs:02}"
+        return _FMT_MS(minutes, secs)
 
 
 def create_output(html_path, mp3_path, segments) -> None:
 
-    for i in range(1, len(segments)):
-
-        segments[i]["start"] = segments[i]["start"] + segments[i]["offset"]
-        segments[i]["time"] = format_duration(segments[i]["start"])
-
-    env = Environment(
-        loader=FileSystemLoader("/Users/admin/gh/tools/yt/data/"),
-        autoescape=True
-    )
-    template = env.get_template("template.html")
+    template = _ENV.get_template("template.html")
     output = template.render(
         segments=segments,
         mp3=mp3_path
@@ -53,16 +69,33 @@ def ensure_transcript(mp3_path, transcript_file):
 
     if not json_out.is_file():
         segment_list = transcribe_long_audio(mp3_path)
-        with json_out.open("w", encoding="utf-8") as f:
-            json.dump(segment_list, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            json_out.write_bytes(
+                orjson.dumps(segment_list, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with json_out.open("w", encoding="utf-8") as f:
+                json.dump(segment_list, f, ensure_ascii=False, indent=4)
 
 
 def get_segment_format(json_path):
-    with json_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    # One bulk read; both parsers take UTF-8 bytes directly
+    raw = json_path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    def finalize(seg):
+        # Absolute start and display timestamp, set here so every
+        # segment gets them (the old create_output loop started at
+        # index 1 and left the first segment without a time)
+        seg["start"] += seg["offset"]
+        seg["time"] = format_duration(seg["start"])
+        return seg
 
     segments = []
     current = data[0]
+    # Accumulate merged text as parts and join once per boundary;
+    # repeated += on the string is quadratic in the segment length
+    parts = [current["text"]]
 
     for i in range(1, len(data)):
         prev = data[i - 1]
@@ -74,14 +107,17 @@ def get_segment_format(json_path):
         #if text_ends_cleanly and time_is_continuous:
         if True:
             # Start a new segment
-            segments.append(current)
+            current["text"] = " ".join(parts)
+            segments.append(finalize(current))
             current = curr
+            parts = [curr["text"]]
         else:
             # Merge with current segment
-            current["text"] += " " + curr["text"]
+            parts.append(curr["text"])
 
     # Append the last accumulated segment
-    segments.append(current)
+    current["text"] = " ".join(parts)
+    segments.append(finalize(current))
 
     return segments
 